@@ -7,7 +7,7 @@ Perfect for showcasing to clients.
 """
 
 import json
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.syntax import Syntax
 from rich.table import Table
@@ -15,68 +15,94 @@ from rich.table import Table
 console = Console()
 
 
+# Static tables never change between runs, so they are built once at import.
+
+TOPIC_TABLE = Table(show_header=True, header_style="bold magenta")
+TOPIC_TABLE.add_column("Field", style="cyan")
+TOPIC_TABLE.add_column("Value", style="white")
+
+TOPIC_TABLE.add_row("Topic", "Best Coffee Shops for Remote Work")
+TOPIC_TABLE.add_row("Business", "Coffee Shop")
+TOPIC_TABLE.add_row("Location", "San Francisco, CA")
+TOPIC_TABLE.add_row("Internal Links", "2 contextual links")
+TOPIC_TABLE.add_row("Target Site", "example.com")
+
+STEPS = [
+    ("1. SEO Metadata Generation", "gpt-4o", "✅ 1.2s"),
+    ("2. Blog Content Creation", "gpt-4o", "✅ 4.8s"),
+    ("3. Categories & Tags", "gpt-4o", "✅ 0.9s"),
+    ("4. Image Search (Pexels)", "pexels-api", "✅ 0.6s"),
+    ("5. Alt Text Generation", "gpt-4o", "✅ 0.5s"),
+    ("6. Quality Validation", "internal", "✅ 0.3s"),
+]
+
+STEP_TABLE = Table(show_header=True, header_style="bold green")
+STEP_TABLE.add_column("Step", style="white")
+STEP_TABLE.add_column("Service", style="cyan")
+STEP_TABLE.add_column("Status", style="green")
+
+for step, service, status in STEPS:
+    STEP_TABLE.add_row(step, service, status)
+
+STATS_TABLE = Table(show_header=True, header_style="bold blue")
+STATS_TABLE.add_column("Metric", style="cyan")
+STATS_TABLE.add_column("Value", style="white")
+STATS_TABLE.add_column("Target", style="dim")
+
+STATS_TABLE.add_row("Word Count", "847", "800-1000 ✅")
+STATS_TABLE.add_row("Headings (H2/H3)", "5", "3-6 ✅")
+STATS_TABLE.add_row("Internal Links", "3", "1-5 ✅")
+STATS_TABLE.add_row("Outbound Links", "1", "1 ✅")
+STATS_TABLE.add_row("SEO Score", "94/100", "80+ ✅")
+STATS_TABLE.add_row("Readability", "Easy", "Target ✅")
+
+PERF_TABLE = Table(show_header=True, header_style="bold magenta")
+PERF_TABLE.add_column("Metric", style="cyan")
+PERF_TABLE.add_column("Value", style="white")
+PERF_TABLE.add_column("Note", style="dim")
+
+PERF_TABLE.add_row("Total Generation Time", "8.3s", "All AI calls completed")
+PERF_TABLE.add_row("OpenAI API Cost", "$0.012", "Per post estimate")
+PERF_TABLE.add_row("Image API Cost", "$0.000", "Free tier")
+PERF_TABLE.add_row("Total Cost per Post", "$0.012", "99% cheaper than manual")
+
+SCALE_TABLE = Table(show_header=True, header_style="bold cyan")
+SCALE_TABLE.add_column("Sites", style="white")
+SCALE_TABLE.add_column("Posts/Month", style="white")
+SCALE_TABLE.add_column("Processing Time", style="green")
+SCALE_TABLE.add_column("Monthly Cost", style="yellow")
+
+SCALE_TABLE.add_row("10 sites", "120 posts", "~17 min", "$1.44 + $5 VPS")
+SCALE_TABLE.add_row("50 sites", "600 posts", "~83 min", "$7.20 + $10 VPS")
+SCALE_TABLE.add_row("100 sites", "1200 posts", "~166 min", "$14.40 + $20 VPS")
+
+
 def show_demo_output():
     """Display impressive demo output."""
 
-    console.print("\n")
-    console.print(Panel.fit(
+    # Everything is collected into one Group and printed in a single pass,
+    # so Rich lays out and writes the whole demo at once.
+    renderables = []
+    add = renderables.append
+
+    add("\n")
+    add(Panel.fit(
         "[bold cyan]AI Blog Agent Demo[/bold cyan]\n"
         "[white]Python + OpenAI Agent SDK[/white]\n"
         "[dim]Automated WordPress Content Generation[/dim]",
         border_style="cyan"
     ))
 
-    console.print("\n[bold yellow]📋 Input Topic:[/bold yellow]")
-    topic_table = Table(show_header=True, header_style="bold magenta")
-    topic_table.add_column("Field", style="cyan")
-    topic_table.add_column("Value", style="white")
-
-    topic_table.add_row("Topic", "Best Coffee Shops for Remote Work")
-    topic_table.add_row("Business", "Coffee Shop")
-    topic_table.add_row("Location", "San Francisco, CA")
-    topic_table.add_row("Internal Links", "2 contextual links")
-    topic_table.add_row("Target Site", "example.com")
-
-    console.print(topic_table)
-
-    console.print("\n[bold yellow]🤖 AI Generation Process:[/bold yellow]")
-
-    steps = [
-        ("1. SEO Metadata Generation", "gpt-4o", "✅ 1.2s"),
-        ("2. Blog Content Creation", "gpt-4o", "✅ 4.8s"),
-        ("3. Categories & Tags", "gpt-4o", "✅ 0.9s"),
-        ("4. Image Search (Pexels)", "pexels-api", "✅ 0.6s"),
-        ("5. Alt Text Generation", "gpt-4o", "✅ 0.5s"),
-        ("6. Quality Validation", "internal", "✅ 0.3s"),
-    ]
-
-    step_table = Table(show_header=True, header_style="bold green")
-    step_table.add_column("Step", style="white")
-    step_table.add_column("Service", style="cyan")
-    step_table.add_column("Status", style="green")
-
-    for step, service, status in steps:
-        step_table.add_row(step, service, status)
+    add("\n[bold yellow]📋 Input Topic:[/bold yellow]")
+    add(TOPIC_TABLE)
 
-    console.print(step_table)
+    add("\n[bold yellow]🤖 AI Generation Process:[/bold yellow]")
+    add(STEP_TABLE)
 
-    console.print("\n[bold yellow]📊 Generated Content Analysis:[/bold yellow]")
+    add("\n[bold yellow]📊 Generated Content Analysis:[/bold yellow]")
+    add(STATS_TABLE)
 
-    stats_table = Table(show_header=True, header_style="bold blue")
-    stats_table.add_column("Metric", style="cyan")
-    stats_table.add_column("Value", style="white")
-    stats_table.add_column("Target", style="dim")
-
-    stats_table.add_row("Word Count", "847", "800-1000 ✅")
-    stats_table.add_row("Headings (H2/H3)", "5", "3-6 ✅")
-    stats_table.add_row("Internal Links", "3", "1-5 ✅")
-    stats_table.add_row("Outbound Links", "1", "1 ✅")
-    stats_table.add_row("SEO Score", "94/100", "80+ ✅")
-    stats_table.add_row("Readability", "Easy", "Target ✅")
-
-    console.print(stats_table)
-
-    console.print("\n[bold yellow]🎯 SEO Metadata:[/bold yellow]")
+    add("\n[bold yellow]🎯 SEO Metadata:[/bold yellow]")
 
     seo_data = {
         "title": "Best Coffee Shops for Remote Work in San Francisco (2025 Guide)",
@@ -86,13 +112,13 @@ def show_demo_output():
         "keywords": ["coffee shops", "remote work", "San Francisco", "coworking"]
     }
 
-    console.print(f"[cyan]Title:[/cyan] {seo_data['title']}")
-    console.print(f"[cyan]Meta Title:[/cyan] {seo_data['meta_title']}")
-    console.print(f"[cyan]Meta Description:[/cyan] {seo_data['meta_description']}")
-    console.print(f"[cyan]Slug:[/cyan] {seo_data['slug']}")
-    console.print(f"[cyan]Keywords:[/cyan] {', '.join(seo_data['keywords'])}")
+    add(f"[cyan]Title:[/cyan] {seo_data['title']}")
+    add(f"[cyan]Meta Title:[/cyan] {seo_data['meta_title']}")
+    add(f"[cyan]Meta Description:[/cyan] {seo_data['meta_description']}")
+    add(f"[cyan]Slug:[/cyan] {seo_data['slug']}")
+    add(f"[cyan]Keywords:[/cyan] {', '.join(seo_data['keywords'])}")
 
-    console.print("\n[bold yellow]📝 Content Preview:[/bold yellow]")
+    add("\n[bold yellow]📝 Content Preview:[/bold yellow]")
 
     sample_content = """
 <p>Finding the perfect coffee shop for remote work in San Francisco can transform your productivity.
@@ -120,9 +146,9 @@ work. Visit during off-peak hours (2-4 PM) for the best seating availability.</p
 """
 
     syntax = Syntax(sample_content.strip(), "html", theme="monokai", line_numbers=False)
-    console.print(Panel(syntax, title="HTML Content Sample", border_style="yellow"))
+    add(Panel(syntax, title="HTML Content Sample", border_style="yellow"))
 
-    console.print("\n[bold yellow]🖼️  Featured Image:[/bold yellow]")
+    add("\n[bold yellow]🖼️  Featured Image:[/bold yellow]")
 
     image_info = {
         "source": "Pexels",
@@ -132,46 +158,24 @@ work. Visit during off-peak hours (2-4 PM) for the best seating availability.</p
         "resolution": "1920x1080"
     }
 
-    console.print(f"[cyan]Source:[/cyan] {image_info['source']}")
-    console.print(f"[cyan]Alt Text:[/cyan] {image_info['alt_text']}")
-    console.print(f"[cyan]Photographer:[/cyan] {image_info['photographer']}")
-    console.print(f"[cyan]Resolution:[/cyan] {image_info['resolution']}")
-
-    console.print("\n[bold yellow]🏷️  Categories & Tags:[/bold yellow]")
-    console.print(f"[cyan]Categories:[/cyan] Local Business, Remote Work")
-    console.print(f"[cyan]Tags:[/cyan] coffee shops, San Francisco, remote work, coworking, wifi, productivity")
-
-    console.print("\n[bold green]✅ Post Ready for Publishing![/bold green]")
+    add(f"[cyan]Source:[/cyan] {image_info['source']}")
+    add(f"[cyan]Alt Text:[/cyan] {image_info['alt_text']}")
+    add(f"[cyan]Photographer:[/cyan] {image_info['photographer']}")
+    add(f"[cyan]Resolution:[/cyan] {image_info['resolution']}")
 
-    console.print("\n[bold yellow]⚡ Performance Metrics:[/bold yellow]")
+    add("\n[bold yellow]🏷️  Categories & Tags:[/bold yellow]")
+    add(f"[cyan]Categories:[/cyan] Local Business, Remote Work")
+    add(f"[cyan]Tags:[/cyan] coffee shops, San Francisco, remote work, coworking, wifi, productivity")
 
-    perf_table = Table(show_header=True, header_style="bold magenta")
-    perf_table.add_column("Metric", style="cyan")
-    perf_table.add_column("Value", style="white")
-    perf_table.add_column("Note", style="dim")
+    add("\n[bold green]✅ Post Ready for Publishing![/bold green]")
 
-    perf_table.add_row("Total Generation Time", "8.3s", "All AI calls completed")
-    perf_table.add_row("OpenAI API Cost", "$0.012", "Per post estimate")
-    perf_table.add_row("Image API Cost", "$0.000", "Free tier")
-    perf_table.add_row("Total Cost per Post", "$0.012", "99% cheaper than manual")
+    add("\n[bold yellow]⚡ Performance Metrics:[/bold yellow]")
+    add(PERF_TABLE)
 
-    console.print(perf_table)
+    add("\n[bold yellow]🚀 Scaling Capabilities:[/bold yellow]")
+    add(SCALE_TABLE)
 
-    console.print("\n[bold yellow]🚀 Scaling Capabilities:[/bold yellow]")
-
-    scale_table = Table(show_header=True, header_style="bold cyan")
-    scale_table.add_column("Sites", style="white")
-    scale_table.add_column("Posts/Month", style="white")
-    scale_table.add_column("Processing Time", style="green")
-    scale_table.add_column("Monthly Cost", style="yellow")
-
-    scale_table.add_row("10 sites", "120 posts", "~17 min", "$1.44 + $5 VPS")
-    scale_table.add_row("50 sites", "600 posts", "~83 min", "$7.20 + $10 VPS")
-    scale_table.add_row("100 sites", "1200 posts", "~166 min", "$14.40 + $20 VPS")
-
-    console.print(scale_table)
-
-    console.print("\n[bold yellow]💡 Key Advantages Over Make.com:[/bold yellow]")
+    add("\n[bold yellow]💡 Key Advantages Over Make.com:[/bold yellow]")
 
     advantages = [
         "✅ 70% cost reduction at scale (50+ sites)",
@@ -185,10 +189,10 @@ work. Visit during off-peak hours (2-4 PM) for the best seating availability.</p
     ]
 
     for advantage in advantages:
-        console.print(f"  {advantage}")
+        add(f"  {advantage}")
 
-    console.print("\n")
-    console.print(Panel.fit(
+    add("\n")
+    add(Panel.fit(
         "[bold green]Demo Complete![/bold green]\n\n"
         "[white]This post was generated in 8.3 seconds using AI.[/white]\n"
         "[white]Ready to publish to WordPress with one command.[/white]\n\n"
@@ -196,6 +200,8 @@ work. Visit during off-peak hours (2-4 PM) for the best seating availability.</p
         border_style="green"
     ))
 
+    console.print(Group(*renderables))
+
 
 if __name__ == "__main__":
     try:
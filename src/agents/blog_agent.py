@@ -1,14 +1,18 @@
 """Main Blog Agent orchestrating the entire content generation and publishing workflow."""
 
-from typing import Optional
+import asyncio
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 from loguru import logger
 
 from src.models.blog_post import BlogTopic, BlogPost, PostLog, ImageMetadata
 from src.models.config import get_settings, WordPressSite
 from src.services.content_generator import ContentGenerator
 from src.services.image_handler import ImageHandler
-from src.services.wordpress_client import WordPressClient
-from src.services.sheets_client import SheetsClient
+
+if TYPE_CHECKING:
+    # gspread/google-auth and the WordPress client are imported on first use
+    from src.services.wordpress_client import WordPressClient
 
 
 class BlogAgent:
@@ -27,16 +31,50 @@ class BlogAgent:
         self.settings = get_settings()
         self.content_generator = ContentGenerator()
         self.image_handler = ImageHandler()
+
+        from src.services.sheets_client import SheetsClient
         self.sheets_client = SheetsClient()
 
+        # gspread is not safe for concurrent writers, so row updates are serialized
+        self._sheets_lock = asyncio.Lock()
+
+        # Status updates and log rows are buffered and written in bulk
+        self._pending_status: List[Tuple[int, str, Optional[str]]] = []
+        self._pending_logs: List[PostLog] = []
+
+        # One WordPress client per site URL, reused for the whole batch
+        self._wp_clients: Dict[str, "WordPressClient"] = {}
+
+        # Connection/auth check per site URL, shared by all topics this batch
+        self._site_checks: Dict[str, "asyncio.Future[bool]"] = {}
+
         logger.info("Blog Agent initialized")
 
-    def process_topic(
+    async def _flush_sheets(self):
+        """
+        Write buffered status updates and log rows to Google Sheets.
+
+        Called as each topic starts and finishes, so a crash loses at most
+        the writes in flight; updates queued while a flush is running go
+        out together in the next one.
+        """
+        async with self._sheets_lock:
+            if not self._pending_status and not self._pending_logs:
+                return
+
+            status_updates, self._pending_status = self._pending_status, []
+            post_logs, self._pending_logs = self._pending_logs, []
+            failed = await asyncio.to_thread(self.sheets_client.flush, status_updates, post_logs)
+
+            # Keep failed updates ahead of newer ones so the next flush retries them
+            self._pending_status[:0] = failed
+
+    async def process_topic(
         self,
         topic: BlogTopic,
         site: WordPressSite,
         status: str = "publish"
-    ) -> bool:
+    ) -> Tuple[bool, PostLog]:
         """
         Process a single topic: generate content, get image, publish to WordPress.
 
@@ -46,34 +84,79 @@ class BlogAgent:
             status: Post status (draft/publish)
 
         Returns:
-            True if successful, False otherwise
+            Tuple of (True if successful, PostLog describing the outcome)
         """
         logger.info(f"Processing topic: {topic.topic} for {site.name}")
 
         try:
-            # Mark as processing
-            self.sheets_client.mark_topic_status(topic.row_number, "Processing")
+            blog_post = await self._publish_topic(topic, site, status)
 
-            # Step 1: Generate SEO metadata
-            logger.info("Generating SEO metadata...")
-            seo_metadata = self.content_generator.generate_seo_metadata(topic)
+        except Exception as e:
+            # Traceback capture is only paid for on the failure path
+            logger.opt(exception=True).error(f"❌ Failed to process topic: {e}")
 
-            # Step 2: Generate blog content
-            logger.info("Generating blog content...")
-            content = self.content_generator.generate_blog_content(topic, seo_metadata)
+            return False, PostLog(
+                site=site.name,
+                post_title=topic.topic,
+                status="Failed",
+                word_count=0,
+                topic=topic.topic,
+                error_message=str(e)
+            )
+
+        logger.success(f"✅ Post published successfully: {blog_post.wordpress_url}")
+
+        return True, PostLog(
+            site=site.name,
+            post_title=blog_post.seo.title,
+            post_url=blog_post.wordpress_url,
+            status="Success",
+            word_count=blog_post.content.word_count,
+            topic=topic.topic
+        )
+
+    async def _publish_topic(
+        self,
+        topic: BlogTopic,
+        site: WordPressSite,
+        status: str
+    ) -> BlogPost:
+        """
+        Generate, illustrate, and publish one topic.
+
+        Raises:
+            Exception: If any step fails; process_topic turns it into a failed PostLog
+        """
+        # Steps 1-4 overlap: only the blog content depends on the SEO
+        # metadata and only the taxonomy depends on the content, so the
+        # alt text, image lookup, and image download run alongside them.
+        # The WordPress connection is verified (and warmed) meanwhile too.
+        logger.debug("Generating SEO metadata and acquiring featured image...")
+        seo_task = asyncio.create_task(
+            asyncio.to_thread(self.content_generator.generate_seo_metadata, topic)
+        )
+        image_task = asyncio.create_task(self._acquire_image(topic))
+        verify_task = asyncio.create_task(self._verify_site(site))
 
-            # Step 3: Generate categories and tags
-            logger.info("Generating categories and tags...")
-            categories, tags = self.content_generator.generate_categories_and_tags(topic, content)
+        try:
+            # Step 1: Generate SEO metadata
+            seo_metadata = await seo_task
 
-            # Step 4: Get featured image
-            logger.info("Acquiring featured image...")
-            alt_text = self.content_generator.generate_alt_text(topic)
-            image_metadata = self.image_handler.get_image_for_topic(topic, alt_text)
+            # Step 2: Generate blog content
+            logger.debug("Generating blog content...")
+            content = await asyncio.to_thread(
+                self.content_generator.generate_blog_content, topic, seo_metadata
+            )
 
-            image_data = None
-            if image_metadata:
-                image_data = self.image_handler.download_and_prepare(image_metadata)
+            # Steps 3-4: Generate categories and tags while the featured
+            # image is found and downloaded
+            logger.debug("Generating categories and tags...")
+            (categories, tags), (image_metadata, image_data) = await asyncio.gather(
+                asyncio.to_thread(
+                    self.content_generator.generate_categories_and_tags, topic, content
+                ),
+                image_task
+            )
 
             # Step 5: Create BlogPost object
             blog_post = BlogPost(
@@ -85,72 +168,53 @@ class BlogAgent:
                 tags=tags,
                 status=status
             )
+        except BaseException:
+            # Never leave a background task unawaited if any step fails
+            image_task.cancel()
+            verify_task.cancel()
+            raise
 
-            # Step 6: Publish to WordPress
-            logger.info(f"Publishing to WordPress: {site.name}")
-            wp_client = WordPressClient(site)
+        # Step 6: Publish to WordPress
+        logger.debug(f"Publishing to WordPress: {site.name}")
+        wp_client = self._get_wp_client(site)
 
-            if not wp_client.test_connection():
-                raise Exception("WordPress connection failed")
+        if not await verify_task:
+            raise Exception("WordPress connection failed")
 
-            post_result = wp_client.create_post(blog_post, image_data)
+        post_result = await asyncio.to_thread(wp_client.create_post, blog_post, image_data)
 
-            if not post_result:
-                raise Exception("WordPress post creation failed")
+        if not post_result:
+            # Re-verify the site (e.g. revoked credentials) on its next post
+            self._site_checks.pop(site.url, None)
+            raise Exception("WordPress post creation failed")
 
-            # Extract post URL
-            post_url = post_result.get("link")
-            post_id = post_result.get("id")
+        # Extract post URL
+        post_url = post_result.get("link")
+        post_id = post_result.get("id")
 
-            logger.info(f"Successfully published: {post_url}")
+        logger.debug(f"Successfully published: {post_url}")
 
-            # Step 7: Update blog post with WordPress data
-            blog_post.wordpress_post_id = post_id
-            blog_post.wordpress_url = post_url
+        # Step 7: Update blog post with WordPress data
+        blog_post.wordpress_post_id = post_id
+        blog_post.wordpress_url = post_url
 
-            # Step 8: Log success
-            self.sheets_client.mark_topic_status(
-                topic.row_number,
-                "Completed",
-                post_url
-            )
+        return blog_post
 
-            post_log = PostLog(
-                site=site.name,
-                post_title=seo_metadata.title,
-                post_url=post_url,
-                status="Success",
-                word_count=content.word_count,
-                topic=topic.topic
-            )
-            self.sheets_client.log_post_result(post_log)
+    def _record_result(self, topic: BlogTopic, post_log: PostLog):
+        """Buffer the topic status update and log row for the next Sheets flush."""
+        if post_log.status == "Success":
+            self._pending_status.append((topic.row_number, "Completed", post_log.post_url))
+        else:
+            self._pending_status.append((topic.row_number, "Failed", None))
+        self._pending_logs.append(post_log)
 
-            logger.success(f"✅ Post published successfully: {post_url}")
-            return True
-
-        except Exception as e:
-            logger.error(f"❌ Failed to process topic: {e}")
-
-            # Log failure
-            self.sheets_client.mark_topic_status(topic.row_number, "Failed")
-
-            post_log = PostLog(
-                site=site.name,
-                post_title=topic.topic,
-                post_url=None,
-                status="Failed",
-                word_count=0,
-                topic=topic.topic,
-                error_message=str(e)
-            )
-            self.sheets_client.log_post_result(post_log)
-
-            return False
-
-    def process_batch(self, limit: Optional[int] = None) -> dict:
+    async def process_batch(self, limit: Optional[int] = None) -> dict:
         """
         Process batch of pending topics from Google Sheets.
 
+        Topics are processed concurrently, capped at ``MAX_CONCURRENT_TOPICS``
+        in flight so OpenAI and WordPress rate limits are respected.
+
         Args:
             limit: Maximum number of topics to process
 
@@ -160,28 +224,68 @@ class BlogAgent:
         logger.info("Starting batch processing...")
 
         # Get pending topics
-        topics = self.sheets_client.get_pending_topics(limit=limit)
+        topics = await asyncio.to_thread(self.sheets_client.get_pending_topics, limit=limit)
 
         if not topics:
             logger.info("No pending topics found")
             return {"success": 0, "failed": 0, "total": 0}
 
-        # Process each topic
         stats = {"success": 0, "failed": 0, "total": len(topics)}
 
+        # Find matching WordPress site for each topic
+        site_index = {
+            self._normalize_domain(site.url): site
+            for site in self.settings.wordpress_sites
+        }
+        jobs = []
         for topic in topics:
-            # Find matching WordPress site
-            site = self._find_site_for_domain(topic.site_domain)
+            site = site_index.get(self._normalize_domain(topic.site_domain))
+            if site is None:
+                site = self._find_site_for_domain(topic.site_domain)
 
             if not site:
                 logger.error(f"No WordPress site configured for domain: {topic.site_domain}")
                 stats["failed"] += 1
                 continue
 
-            # Process topic
-            success = self.process_topic(topic, site, status="publish")
+            jobs.append((topic, site))
+
+        # Process topics concurrently
+        semaphore = asyncio.Semaphore(self.settings.max_concurrent_topics)
+
+        async def run(topic: BlogTopic, site: WordPressSite) -> bool:
+            async with semaphore:
+                # Marked only once work starts, so an interrupted batch leaves
+                # unstarted rows pending rather than stuck in Processing
+                self._pending_status.append((topic.row_number, "Processing", None))
+                await self._flush_sheets()
+
+                success, post_log = await self.process_topic(topic, site, status="publish")
+
+            self._record_result(topic, post_log)
+            await self._flush_sheets()
+            return success
 
-            if success:
+        try:
+            results = await asyncio.gather(
+                *(run(topic, site) for topic, site in jobs),
+                return_exceptions=True
+            )
+        finally:
+            self._close_wp_clients()
+            await self._flush_sheets()
+            if self._pending_status:
+                rows = sorted({row for row, _, _ in self._pending_status})
+                logger.error(
+                    f"Could not write final statuses for rows {rows}; update them by "
+                    f"hand, or they are retried after PROCESSING_TIMEOUT_MINUTES"
+                )
+
+        for (topic, _), result in zip(jobs, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Unexpected error processing {topic.topic}: {result}")
+                stats["failed"] += 1
+            elif result:
                 stats["success"] += 1
             else:
                 stats["failed"] += 1
@@ -193,14 +297,80 @@ class BlogAgent:
 
         return stats
 
+    def _get_wp_client(self, site: WordPressSite) -> "WordPressClient":
+        """Get the cached WordPress client for a site, creating it on first use."""
+        client = self._wp_clients.get(site.url)
+        if client is None:
+            from src.services.wordpress_client import WordPressClient
+            client = WordPressClient(site, self.settings.media_cache_dir)
+            self._wp_clients[site.url] = client
+        return client
+
+    def _close_wp_clients(self):
+        """Close and forget all cached WordPress clients."""
+        for client in self._wp_clients.values():
+            client.close()
+        self._wp_clients.clear()
+        self._site_checks.clear()
+
+    async def _verify_site(self, site: WordPressSite) -> bool:
+        """
+        Check a site's connection and credentials once per batch.
+
+        Concurrent topics for the same site await a single check. A failed
+        check is forgotten so the next topic retries it; later failures are
+        surfaced by create_post, which evicts the site so it is checked again.
+        """
+        check = self._site_checks.get(site.url)
+        if check is None:
+            wp_client = self._get_wp_client(site)
+            check = asyncio.ensure_future(asyncio.to_thread(wp_client.test_connection))
+            self._site_checks[site.url] = check
+
+        # Shielded so one topic cancelling its wait does not cancel the others'
+        if await asyncio.shield(check):
+            return True
+
+        if self._site_checks.get(site.url) is check:
+            del self._site_checks[site.url]
+        return False
+
+    async def _acquire_image(
+        self,
+        topic: BlogTopic
+    ) -> Tuple[Optional[ImageMetadata], Optional[bytes]]:
+        """Generate alt text, find a featured image using it, and download it."""
+        alt_text = await asyncio.to_thread(self.content_generator.generate_alt_text, topic)
+        image_metadata = await asyncio.to_thread(
+            self.image_handler.get_image_for_topic, topic, alt_text
+        )
+
+        image_data = None
+        if image_metadata:
+            image_data = await asyncio.to_thread(
+                self.image_handler.download_and_prepare, image_metadata
+            )
+
+        return image_metadata, image_data
+
+    @staticmethod
+    def _normalize_domain(value: str) -> str:
+        """Reduce a URL or bare domain to a lowercase host without 'www.'."""
+        value = value.strip().lower()
+        host = urlparse(value).netloc if "://" in value else value.split("/", 1)[0]
+        return host.removeprefix("www.")
+
     def _find_site_for_domain(self, domain: str) -> Optional[WordPressSite]:
-        """Find WordPress site configuration matching domain."""
+        """Find WordPress site configuration matching domain (substring scan)."""
+        # An empty domain would be a substring of every site URL
+        if not domain.strip():
+            return None
         for site in self.settings.wordpress_sites:
             if domain.lower() in site.url.lower():
                 return site
         return None
 
-    def generate_demo_post(self, demo_topic: Optional[dict] = None) -> bool:
+    async def generate_demo_post(self, demo_topic: Optional[dict] = None) -> bool:
         """
         Generate a demo post for testing (doesn't publish to WordPress).
 
@@ -223,12 +393,22 @@ class BlogAgent:
 
         logger.info("Generating demo content (not publishing)...")
 
+        # Alt text only needs the topic, so it runs alongside the SEO -> content ->
+        # taxonomy chain instead of after it
+        alt_task = asyncio.create_task(
+            asyncio.to_thread(self.content_generator.generate_alt_text, topic)
+        )
+
         try:
             # Generate all content
-            seo = self.content_generator.generate_seo_metadata(topic)
-            content = self.content_generator.generate_blog_content(topic, seo)
-            categories, tags = self.content_generator.generate_categories_and_tags(topic, content)
-            alt_text = self.content_generator.generate_alt_text(topic)
+            seo = await asyncio.to_thread(self.content_generator.generate_seo_metadata, topic)
+            content = await asyncio.to_thread(
+                self.content_generator.generate_blog_content, topic, seo
+            )
+            categories, tags = await asyncio.to_thread(
+                self.content_generator.generate_categories_and_tags, topic, content
+            )
+            alt_text = await alt_task
 
             # Display results
             logger.info("\n" + "="*60)
@@ -250,5 +430,6 @@ class BlogAgent:
             return True
 
         except Exception as e:
+            alt_task.cancel()
             logger.error(f"Demo generation failed: {e}")
             return False
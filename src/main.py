@@ -1,16 +1,22 @@
 """Main entry point for AI Blog Agent with scheduling support."""
 
 import sys
+import asyncio
 import argparse
 from datetime import datetime
-from apscheduler.schedulers.blocking import BlockingScheduler
-from apscheduler.triggers.cron import CronTrigger
 from loguru import logger
 
-from src.models.config import get_settings
-from src.agents.blog_agent import BlogAgent
 from src.utils.logger import setup_logger
-from src.utils.notifications import NotificationService
+
+# Heavier modules (agent, services, scheduler, settings) are imported inside
+# the command that needs them so --help and single-mode runs start quickly.
+
+# Cron day_of_week spread for a given number of posts per week
+POSTING_DAYS = {
+    1: "mon",
+    2: "tue,thu",
+    3: "mon,wed,fri",
+}
 
 
 def run_batch_job(limit: int = None):
@@ -25,12 +31,16 @@ def run_batch_job(limit: int = None):
     logger.info("="*60)
 
     try:
+        from src.agents.blog_agent import BlogAgent
+        from src.utils.notifications import get_notification_service
+
         agent = BlogAgent()
-        stats = agent.process_batch(limit=limit)
+        stats = asyncio.run(agent.process_batch(limit=limit))
 
         # Send notification
-        notifier = NotificationService()
+        notifier = get_notification_service()
         notifier.send_batch_summary(stats)
+        notifier.flush()
 
         logger.info(f"Batch job completed: {stats}")
 
@@ -44,8 +54,10 @@ def run_demo():
     logger.info("Running in DEMO mode (no WordPress publishing)")
 
     try:
+        from src.agents.blog_agent import BlogAgent
+
         agent = BlogAgent()
-        success = agent.generate_demo_post()
+        success = asyncio.run(agent.generate_demo_post())
 
         if success:
             logger.success("Demo completed successfully!")
@@ -60,6 +72,10 @@ def run_demo():
 
 def setup_scheduler():
     """Setup automated scheduler based on configuration."""
+    from apscheduler.schedulers.blocking import BlockingScheduler
+    from apscheduler.triggers.cron import CronTrigger
+    from src.models.config import get_settings
+
     settings = get_settings()
 
     scheduler = BlockingScheduler()
@@ -68,17 +84,8 @@ def setup_scheduler():
     posts_per_week = settings.posts_per_week_per_site
     posting_hours = settings.posting_hours_list
 
-    # For 3 posts per week, schedule for Mon, Wed, Fri
-    # For 2 posts per week, schedule for Tue, Thu
-    if posts_per_week == 3:
-        days = "mon,wed,fri"
-    elif posts_per_week == 2:
-        days = "tue,thu"
-    elif posts_per_week == 1:
-        days = "mon"
-    else:
-        # Daily or custom
-        days = "*"
+    # Daily for any other value
+    days = POSTING_DAYS.get(posts_per_week, "*")
 
     # Schedule for each posting hour
     for hour in posting_hours:
@@ -128,6 +135,8 @@ def test_connections():
     """Test all API connections."""
     logger.info("Testing connections...")
 
+    from src.models.config import get_settings
+
     settings = get_settings()
     all_ok = True
 
@@ -160,6 +169,7 @@ def test_connections():
     try:
         from src.services.sheets_client import SheetsClient
         sheets_client = SheetsClient()
+        sheets_client.sheet  # Connects lazily; force authentication and open
         logger.success("✅ Google Sheets connection OK")
     except Exception as e:
         logger.error(f"❌ Google Sheets connection failed: {e}")
@@ -218,8 +228,11 @@ def main():
 
     args = parser.parse_args()
 
-    # Setup logging
-    setup_logger(log_level=args.log_level)
+    # Setup logging (unattended batch/scheduler runs keep the console quiet)
+    setup_logger(
+        log_level=args.log_level,
+        batch_mode=args.batch is not None or args.schedule
+    )
 
     logger.info("AI Blog Agent starting...")
 
@@ -1,8 +1,9 @@
 """Blog post data models."""
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 
 class BlogTopic(BaseModel):
@@ -18,22 +19,27 @@ class BlogTopic(BaseModel):
     site_domain: str = Field(..., description="Target WordPress site domain")
     row_number: int = Field(..., description="Row number in Google Sheets")
 
+    model_config = ConfigDict(frozen=True)
+
     @classmethod
     def from_sheet_row(cls, row: dict, row_number: int) -> "BlogTopic":
-        """Create BlogTopic from Google Sheets row."""
-        internal_links_str = row.get("Internal Link URLs", "")
-        internal_links = [
-            link.strip()
-            for link in internal_links_str.split(",")
-            if link.strip()
-        ]
-
-        return cls(
-            topic=row.get("Topic", ""),
-            business_type=row.get("Business Type", ""),
-            location=row.get("Location", ""),
+        """
+        Create BlogTopic from Google Sheets row.
+
+        Rows come from our own sheet with a known schema, so the model is
+        built with ``model_construct`` and field validation is skipped.
+        Cells are coerced to ``str`` because gspread returns numbers for
+        numeric-looking values.
+        """
+        raw_links = str(row.get("Internal Link URLs") or "")
+        internal_links = [link for link in map(str.strip, raw_links.split(",")) if link]
+
+        return cls.model_construct(
+            topic=str(row.get("Topic", "")),
+            business_type=str(row.get("Business Type", "")),
+            location=str(row.get("Location", "")),
             internal_links=internal_links,
-            site_domain=row.get("Site Domain", ""),
+            site_domain=str(row.get("Site Domain", "")),
             row_number=row_number
         )
 
@@ -47,6 +53,8 @@ class SEOMetadata(BaseModel):
     slug: str = Field(..., description="URL slug")
     keywords: List[str] = Field(default_factory=list, description="Focus keywords")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class GeneratedContent(BaseModel):
     """AI-generated blog content."""
@@ -60,6 +68,8 @@ class GeneratedContent(BaseModel):
     )
     outbound_link: Optional[str] = Field(None, description="Authority outbound link")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ImageMetadata(BaseModel):
     """Featured image metadata."""
@@ -92,8 +102,17 @@ class BlogPost(BaseModel):
     wordpress_post_id: Optional[int] = Field(None, description="WordPress post ID")
     wordpress_url: Optional[str] = Field(None, description="Published post URL")
 
-    def to_wordpress_payload(self) -> dict:
-        """Convert to WordPress REST API payload."""
+    def to_wordpress_payload(self, featured_media_id: Optional[int] = None) -> dict:
+        """
+        Convert to WordPress REST API payload.
+
+        Args:
+            featured_media_id: Media ID of the uploaded featured image (optional)
+
+        Returns:
+            Payload dict; categories and tags hold names and must be
+            replaced with term IDs before posting
+        """
         payload = {
             "title": self.seo.title,
             "content": self.content.html_content,
@@ -107,24 +126,31 @@ class BlogPost(BaseModel):
             "tags": self.tags,
         }
 
-        # Add featured image if available
-        if self.image and hasattr(self, 'featured_media_id'):
-            payload["featured_media"] = self.featured_media_id
+        # Add featured image if uploaded
+        if featured_media_id:
+            payload["featured_media"] = featured_media_id
 
         return payload
 
 
-class PostLog(BaseModel):
-    """Logging entry for Google Sheets."""
-
-    site: str = Field(..., description="Site name")
-    post_title: str = Field(..., description="Post title")
-    post_url: Optional[str] = Field(None, description="Published URL")
-    status: str = Field(..., description="Success/Failed/Pending")
-    date: datetime = Field(default_factory=datetime.utcnow)
-    error_message: Optional[str] = Field(None, description="Error details if failed")
-    word_count: int = Field(..., description="Word count")
-    topic: str = Field(..., description="Original topic")
+@dataclass(frozen=True, slots=True)
+class PostLog:
+    """
+    Logging entry for Google Sheets.
+
+    A plain slotted dataclass rather than a pydantic model: it is built by
+    our own code once per topic and only serialized, so validation is
+    pure overhead.
+    """
+
+    site: str  # Site name
+    post_title: str  # Post title
+    status: str  # Success/Failed/Pending
+    word_count: int  # Word count
+    topic: str  # Original topic
+    post_url: Optional[str] = None  # Published URL
+    date: datetime = field(default_factory=datetime.utcnow)
+    error_message: Optional[str] = None  # Error details if failed
 
     def to_sheet_row(self) -> List[str]:
         """Convert to Google Sheets row format."""
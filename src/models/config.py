@@ -1,9 +1,15 @@
 """Configuration models and settings management."""
 
+import hashlib
+import os
+from functools import cached_property, lru_cache
+from pathlib import Path
 from typing import List, Optional
-from pydantic import Field, field_validator
+import pydantic
+from pydantic import Field, PrivateAttr, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
-import json
+import orjson
+from loguru import logger
 
 
 class WordPressSite(BaseSettings):
@@ -13,6 +19,10 @@ class WordPressSite(BaseSettings):
     url: str = Field(..., description="WordPress site URL")
     username: str = Field(..., description="WordPress username")
     app_password: str = Field(..., description="WordPress application password")
+    gzip_requests: bool = Field(
+        default=False,
+        description="Gzip large request bodies (server must accept Content-Encoding: gzip)"
+    )
 
     model_config = SettingsConfigDict(extra='ignore')
 
@@ -46,12 +56,19 @@ class Settings(BaseSettings):
     posts_per_week_per_site: int = Field(default=3, alias="POSTS_PER_WEEK_PER_SITE")
     posting_hours: str = Field(default="9,12,15", alias="POSTING_HOURS")
 
+    # Batch Processing
+    max_concurrent_topics: int = Field(default=3, ge=1, alias="MAX_CONCURRENT_TOPICS")
+    processing_timeout_minutes: int = Field(default=120, ge=1, alias="PROCESSING_TIMEOUT_MINUTES")
+
     # Content Configuration
     min_word_count: int = Field(default=800, alias="MIN_WORD_COUNT")
     max_word_count: int = Field(default=1000, alias="MAX_WORD_COUNT")
     enable_internal_linking: bool = Field(default=True, alias="ENABLE_INTERNAL_LINKING")
     min_internal_links: int = Field(default=1, alias="MIN_INTERNAL_LINKS")
     max_internal_links: int = Field(default=5, alias="MAX_INTERNAL_LINKS")
+    generation_cache_dir: Optional[str] = Field(default=None, alias="GENERATION_CACHE_DIR")
+    generation_cache_ttl_hours: float = Field(default=24, gt=0, alias="GENERATION_CACHE_TTL_HOURS")
+    media_cache_dir: Optional[str] = Field(default=None, alias="MEDIA_CACHE_DIR")
 
     # Logging
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
@@ -64,40 +81,109 @@ class Settings(BaseSettings):
         extra='ignore'
     )
 
-    @field_validator('wordpress_sites_json')
-    @classmethod
-    def validate_wordpress_sites(cls, v: str) -> str:
-        """Validate WordPress sites JSON format."""
+    # Parsed WORDPRESS_SITES, built once by the validator below
+    _wordpress_sites: List[WordPressSite] = PrivateAttr(default_factory=list)
+
+    @model_validator(mode='after')
+    def validate_wordpress_sites(self) -> "Settings":
+        """Validate WordPress sites JSON format and parse it once."""
         try:
-            sites = json.loads(v)
-            if not isinstance(sites, list):
-                raise ValueError("WORDPRESS_SITES must be a JSON array")
-            for site in sites:
-                if not all(k in site for k in ['name', 'url', 'username', 'app_password']):
-                    raise ValueError("Each site must have: name, url, username, app_password")
-            return v
-        except json.JSONDecodeError as e:
+            sites = orjson.loads(self.wordpress_sites_json)
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in WORDPRESS_SITES: {e}")
 
+        if not isinstance(sites, list):
+            raise ValueError("WORDPRESS_SITES must be a JSON array")
+        for site in sites:
+            if not all(k in site for k in ['name', 'url', 'username', 'app_password']):
+                raise ValueError("Each site must have: name, url, username, app_password")
+
+        self._wordpress_sites = [WordPressSite(**site) for site in sites]
+        return self
+
     @property
     def wordpress_sites(self) -> List[WordPressSite]:
-        """Parse WordPress sites from JSON string."""
-        sites_data = json.loads(self.wordpress_sites_json)
-        return [WordPressSite(**site) for site in sites_data]
+        """WordPress sites parsed from the WORDPRESS_SITES JSON string."""
+        return self._wordpress_sites
 
-    @property
+    @cached_property
     def posting_hours_list(self) -> List[int]:
-        """Parse posting hours into list of integers."""
+        """Parse posting hours into list of integers (parsed once per instance)."""
         return [int(h.strip()) for h in self.posting_hours.split(',')]
 
 
-# Global settings instance
-settings: Optional[Settings] = None
+# Validated settings are snapshotted here so later runs with the same
+# .env/environment skip env-file parsing and validation. Like env_file this
+# is relative to the project directory, so the snapshot (which holds the same
+# secrets as config/.env) never leaves the checkout it belongs to.
+SETTINGS_CACHE_DIR = Path(".cache/settings")
+
+
+def _settings_cache_key() -> str:
+    """Hash everything a Settings() load depends on: schema, .env bytes and env vars."""
+    digest = hashlib.blake2b(digest_size=16)
+
+    # This module's source covers field defaults, constraints and validators,
+    # so a code change never reuses a snapshot built under the old rules
+    digest.update(pydantic.VERSION.encode())
+    digest.update(Path(__file__).read_bytes())
+
+    try:
+        digest.update(Path(Settings.model_config["env_file"]).read_bytes())
+    except OSError:
+        pass
 
+    aliases = {(field.alias or name).upper() for name, field in Settings.model_fields.items()}
+    for key in sorted(os.environ):
+        if key.upper() in aliases:
+            digest.update(f"\0{key}={os.environ[key]}".encode())
 
+    return digest.hexdigest()
+
+
+def _load_settings_snapshot(path: Path) -> Optional[Settings]:
+    """Rebuild Settings from a snapshot without re-reading the environment."""
+    try:
+        data = orjson.loads(path.read_bytes())
+        settings = Settings.model_construct(**data)
+        settings.validate_wordpress_sites()
+        return settings
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unusable settings snapshot {path.name}: {e}")
+        return None
+
+
+def _save_settings_snapshot(path: Path, settings: Settings):
+    """Write a snapshot readable only by the current user (it holds API keys)."""
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Only this checkout's snapshots live here; drop the outdated ones
+        for stale in path.parent.glob("settings-*.json"):
+            stale.unlink(missing_ok=True)
+
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(settings.model_dump()))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get or create settings singleton."""
-    global settings
+    """
+    Get or create settings singleton (call get_settings.cache_clear() to reload).
+
+    A snapshot of the last validated settings is reused while the .env file
+    and relevant environment variables are unchanged.
+    """
+    path = SETTINGS_CACHE_DIR / f"settings-{_settings_cache_key()}.json"
+
+    settings = _load_settings_snapshot(path)
     if settings is None:
         settings = Settings()
+        _save_settings_snapshot(path, settings)
     return settings
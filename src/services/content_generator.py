@@ -1,26 +1,20 @@
 """OpenAI-powered content generation service."""
 
 import re
-from typing import List, Optional
+from functools import cached_property
+from typing import Iterator, List, Optional
+import orjson
 from openai import OpenAI
 from loguru import logger
 
 from src.models.blog_post import BlogTopic, SEOMetadata, GeneratedContent
 from src.models.config import get_settings
+from src.utils.cache import DiskCache
+from src.utils.textstats import HtmlStatsParser, slugify
 
 
-class ContentGenerator:
-    """AI content generator using OpenAI Agent SDK."""
-
-    def __init__(self):
-        """Initialize OpenAI client."""
-        self.settings = get_settings()
-        self.client = OpenAI(api_key=self.settings.openai_api_key)
-        self.model = self.settings.openai_model
-
-    def generate_seo_metadata(self, topic: BlogTopic) -> SEOMetadata:
-        """Generate SEO-optimized metadata."""
-        prompt = f"""Generate SEO metadata for a blog post about "{topic.topic}" for a {topic.business_type} in {topic.location}.
+# Prompt scaffolds, built once and filled in per call with str.format
+_SEO_PROMPT = """Generate SEO metadata for a blog post about "{topic.topic}" for a {topic.business_type} in {topic.location}.
 
 Return ONLY a JSON object with this exact structure (no markdown, no explanation):
 {{
@@ -37,57 +31,27 @@ Requirements:
 - Slug should be lowercase with hyphens
 - Include 3-5 relevant keywords"""
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": "You are an SEO expert. Return only valid JSON."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            response_format={"type": "json_object"}
-        )
-
-        metadata_json = response.choices[0].message.content
-        logger.debug(f"Generated SEO metadata: {metadata_json}")
-
-        import json
-        metadata = json.loads(metadata_json)
-        return SEOMetadata(**metadata)
-
-    def generate_blog_content(
-        self,
-        topic: BlogTopic,
-        seo: SEOMetadata,
-        existing_posts_context: Optional[str] = None
-    ) -> GeneratedContent:
-        """Generate complete blog post content with intelligent linking."""
-
-        # Prepare internal links context
-        internal_links_context = ""
-        if topic.internal_links and self.settings.enable_internal_linking:
-            links_list = "\n".join([f"- {link}" for link in topic.internal_links])
-            internal_links_context = f"""
-Internal links to use ({self.settings.min_internal_links}-{self.settings.max_internal_links} links, naturally placed):
+_INTERNAL_LINKS_PROMPT = """
+Internal links to use ({settings.min_internal_links}-{settings.max_internal_links} links, naturally placed):
 {links_list}
 
 Place these links ONLY where contextually relevant. Use descriptive anchor text, not "click here".
 """
 
-        # Build comprehensive prompt
-        prompt = f"""Write a professional, SEO-optimized blog post for:
+_BLOG_PROMPT = """Write a professional, SEO-optimized blog post for:
 
 **Topic**: {topic.topic}
 **Business**: {topic.business_type} in {topic.location}
-**Target Length**: {self.settings.min_word_count}-{self.settings.max_word_count} words
+**Target Length**: {settings.min_word_count}-{settings.max_word_count} words
 **SEO Title**: {seo.title}
 
 {internal_links_context}
 
 **Requirements**:
-1. Write {self.settings.min_word_count}-{self.settings.max_word_count} words of engaging, informative content
+1. Write {settings.min_word_count}-{settings.max_word_count} words of engaging, informative content
 2. Use HTML formatting: <h2> for main sections, <h3> for subsections, <p> for paragraphs
 3. Include 2-3 <h2> headings that break up the content logically
-4. Add {self.settings.min_internal_links}-{self.settings.max_internal_links} internal links naturally in context (use provided URLs)
+4. Add {settings.min_internal_links}-{settings.max_internal_links} internal links naturally in context (use provided URLs)
 5. Include ONE outbound link to a reputable authority website (Wikipedia, .edu, industry leader)
 6. Write in a professional, helpful tone
 7. Focus on providing value to readers in {topic.location}
@@ -104,7 +68,116 @@ Place these links ONLY where contextually relevant. Use descriptive anchor text,
 Return ONLY the HTML content (no title, no meta tags, just the article body).
 """
 
+_ALT_PROMPT = """Generate a concise, descriptive alt text (max 125 characters) for a featured image for a blog post about "{topic.topic}" for a {topic.business_type} in {topic.location}.
+
+The alt text should be:
+- Descriptive and specific
+- Include relevant keywords naturally
+- Be useful for visually impaired users
+- Not start with "image of" or "picture of"
+
+Return ONLY the alt text, nothing else."""
+
+_TAXONOMY_PROMPT = """Based on this blog post topic and content, suggest WordPress categories and tags.
+
+Topic: {topic.topic}
+Business: {topic.business_type}
+Location: {topic.location}
+Headings: {headings}
+
+Return ONLY a JSON object with this structure:
+{{
+  "categories": ["Category 1", "Category 2"],
+  "tags": ["tag1", "tag2", "tag3", "tag4", "tag5"]
+}}
+
+Requirements:
+- 1-2 broad categories (e.g., "Local Business", "Services", industry name)
+- 5-8 specific tags (keywords, topics, location-based)"""
+
+
+class ContentGenerator:
+    """AI content generator using OpenAI Agent SDK."""
+
+    def __init__(self):
+        """Initialize generator settings; the OpenAI client is built on first use."""
+        self.settings = get_settings()
+        self.model = self.settings.openai_model
+
+        # SEO metadata and alt text depend only on the topic and site, so
+        # retries and re-runs reuse recent results instead of paying for new
+        # completions (opt-in: a reused slug would collide with an earlier post)
+        self.cache = DiskCache(
+            self.settings.generation_cache_dir,
+            ttl=self.settings.generation_cache_ttl_hours * 3600
+        )
+
+    @cached_property
+    def client(self) -> OpenAI:
+        """OpenAI client, created on first request."""
+        return OpenAI(api_key=self.settings.openai_api_key)
+
+    def _cache_key(self, kind: str, topic: BlogTopic) -> str:
+        """Build the cache key for a generation that depends only on the topic and site."""
+        return DiskCache.make_key(
+            kind, self.model, topic.site_domain, topic.topic, topic.business_type, topic.location
+        )
+
+    def generate_seo_metadata(self, topic: BlogTopic) -> SEOMetadata:
+        """Generate SEO-optimized metadata."""
+        cache_key = self._cache_key("seo", topic)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Using cached SEO metadata for: {topic.topic}")
+            return SEOMetadata(**cached)
+
+        prompt = _SEO_PROMPT.format(topic=topic)
+
         response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": "You are an SEO expert. Return only valid JSON."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.7,
+            response_format={"type": "json_object"}
+        )
+
+        metadata_json = response.choices[0].message.content
+        logger.debug(f"Generated SEO metadata: {metadata_json}")
+
+        data = orjson.loads(metadata_json)
+        data["slug"] = slugify(data.get("slug") or data.get("title", ""))
+        metadata = SEOMetadata(**data)
+        self.cache.set(cache_key, metadata.model_dump())
+        return metadata
+
+    def stream_blog_content(
+        self,
+        topic: BlogTopic,
+        seo: SEOMetadata,
+        existing_posts_context: Optional[str] = None
+    ) -> Iterator[str]:
+        """Stream blog post HTML from OpenAI, yielding text chunks as they arrive."""
+
+        # Prepare internal links context
+        internal_links_context = ""
+        if topic.internal_links and self.settings.enable_internal_linking:
+            links_list = "\n".join([f"- {link}" for link in topic.internal_links])
+            internal_links_context = _INTERNAL_LINKS_PROMPT.format(
+                settings=self.settings,
+                links_list=links_list
+            )
+
+        # Build comprehensive prompt
+        prompt = _BLOG_PROMPT.format(
+            topic=topic,
+            seo=seo,
+            settings=self.settings,
+            internal_links_context=internal_links_context
+        )
+
+        stream = self.client.chat.completions.create(
             model=self.model,
             messages=[
                 {
@@ -114,22 +187,42 @@ Return ONLY the HTML content (no title, no meta tags, just the article body).
                 {"role": "user", "content": prompt}
             ],
             temperature=0.7,
+            stream=True,
         )
 
-        html_content = response.choices[0].message.content.strip()
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
 
-        # Extract metadata from content
-        word_count = len(re.findall(r'\w+', re.sub(r'<[^>]+>', '', html_content)))
-        headings = re.findall(r'<h[23]>(.*?)</h[23]>', html_content)
+    def generate_blog_content(
+        self,
+        topic: BlogTopic,
+        seo: SEOMetadata,
+        existing_posts_context: Optional[str] = None
+    ) -> GeneratedContent:
+        """Generate complete blog post content with intelligent linking."""
+        # Parse each chunk as it arrives so extraction overlaps generation
+        parser = HtmlStatsParser()
+        parts = []
+        for chunk in self.stream_blog_content(topic, seo, existing_posts_context):
+            parts.append(chunk)
+            parser.feed(chunk)
+        parser.close()
+
+        html_content = "".join(parts).strip()
+        word_count, headings, links = parser.word_count, parser.headings, parser.links
 
-        # Extract links
         internal_links_used = []
         outbound_link = None
 
-        for link in re.findall(r'<a\s+href=["\'](.*?)["\']', html_content):
-            if any(internal in link for internal in topic.internal_links):
+        # One compiled alternation checks every internal URL in a single scan
+        internal_urls = [re.escape(url) for url in topic.internal_links if url]
+        internal_re = re.compile("|".join(internal_urls)) if internal_urls else None
+
+        for link in links:
+            if internal_re and internal_re.search(link):
                 internal_links_used.append(link)
-            elif not any(domain in link for domain in [topic.site_domain]):
+            elif topic.site_domain not in link:
                 outbound_link = link
 
         logger.info(
@@ -148,15 +241,13 @@ Return ONLY the HTML content (no title, no meta tags, just the article body).
 
     def generate_alt_text(self, topic: BlogTopic) -> str:
         """Generate descriptive alt text for images."""
-        prompt = f"""Generate a concise, descriptive alt text (max 125 characters) for a featured image for a blog post about "{topic.topic}" for a {topic.business_type} in {topic.location}.
+        cache_key = self._cache_key("alt_text", topic)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Using cached alt text for: {topic.topic}")
+            return cached
 
-The alt text should be:
-- Descriptive and specific
-- Include relevant keywords naturally
-- Be useful for visually impaired users
-- Not start with "image of" or "picture of"
-
-Return ONLY the alt text, nothing else."""
+        prompt = _ALT_PROMPT.format(topic=topic)
 
         response = self.client.chat.completions.create(
             model=self.model,
@@ -171,26 +262,16 @@ Return ONLY the alt text, nothing else."""
         alt_text = response.choices[0].message.content.strip().strip('"\'')
         logger.debug(f"Generated alt text: {alt_text}")
 
-        return alt_text[:125]  # Enforce max length
+        alt_text = alt_text[:125]  # Enforce max length
+        self.cache.set(cache_key, alt_text)
+        return alt_text
 
     def generate_categories_and_tags(self, topic: BlogTopic, content: GeneratedContent) -> tuple[List[str], List[str]]:
         """Generate relevant categories and tags for WordPress."""
-        prompt = f"""Based on this blog post topic and content, suggest WordPress categories and tags.
-
-Topic: {topic.topic}
-Business: {topic.business_type}
-Location: {topic.location}
-Headings: {', '.join(content.headings[:3])}
-
-Return ONLY a JSON object with this structure:
-{{
-  "categories": ["Category 1", "Category 2"],
-  "tags": ["tag1", "tag2", "tag3", "tag4", "tag5"]
-}}
-
-Requirements:
-- 1-2 broad categories (e.g., "Local Business", "Services", industry name)
-- 5-8 specific tags (keywords, topics, location-based)"""
+        prompt = _TAXONOMY_PROMPT.format(
+            topic=topic,
+            headings=', '.join(content.headings[:3])
+        )
 
         response = self.client.chat.completions.create(
             model=self.model,
@@ -202,7 +283,6 @@ Requirements:
             response_format={"type": "json_object"}
         )
 
-        import json
-        taxonomy = json.loads(response.choices[0].message.content)
+        taxonomy = orjson.loads(response.choices[0].message.content)
 
         return taxonomy.get("categories", []), taxonomy.get("tags", [])
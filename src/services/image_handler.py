@@ -1,27 +1,65 @@
-"""Image acquisition service with waterfall fallback (Pexels → Unsplash → DALL-E)."""
+"""Image acquisition service with fallback (Pexels + Unsplash in parallel → DALL-E)."""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from typing import Callable, Optional
 from loguru import logger
 from openai import OpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
 from src.models.blog_post import BlogTopic, ImageMetadata
 from src.models.config import get_settings
+from src.utils.cache import TTLCache
+from src.utils.http import is_transient_error
+
+# Cache sentinel distinguishing "not cached" from a cached empty result
+_MISSING = object()
+
+# DALL-E prompt scaffold, filled in per call with str.format
+_DALLE_PROMPT = """Professional, high-quality photograph for a blog about {topic.topic} for a {topic.business_type} in {topic.location}.
+
+Style: Clean, modern, professional photography
+Mood: Trustworthy and welcoming
+Lighting: Natural, well-lit
+Composition: Landscape orientation, suitable for blog featured image
+
+{alt_text}
+
+No text, no people's faces, no logos."""
 
 
 class ImageHandler:
     """Handles image acquisition with waterfall fallback system."""
 
+    # Upper bound for a downloaded featured image
+    MAX_IMAGE_BYTES = 20 * 1024 * 1024
+
     def __init__(self):
         """Initialize API clients."""
         self.settings = get_settings()
-        self.openai_client = OpenAI(api_key=self.settings.openai_api_key)
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
+        # Shared keep-alive session for the stock photo APIs and image CDNs
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
+        # Worker threads for the parallel Pexels/Unsplash searches of all topics
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="image-search")
+
+        # Topics often share queries; keep search results briefly, as both
+        # providers allow short-lived caching of API responses
+        self._search_cache = TTLCache(maxsize=256, ttl=3600)
+
+    @cached_property
+    def openai_client(self) -> OpenAI:
+        """OpenAI client for DALL-E, created only if the fallback is reached."""
+        return OpenAI(api_key=self.settings.openai_api_key)
+
     def get_image_for_topic(self, topic: BlogTopic, alt_text: str) -> Optional[ImageMetadata]:
         """
-        Get image using waterfall approach: Pexels → Unsplash → DALL-E.
+        Get image from Pexels or Unsplash (queried in parallel), then DALL-E.
 
         Args:
             topic: Blog topic
@@ -32,14 +70,12 @@ class ImageHandler:
         """
         logger.info(f"Searching for image: {topic.topic}")
 
-        # Try Pexels first
-        image = self._try_pexels(topic.topic)
-        if image:
-            image.alt_text = alt_text
-            return image
+        # Query both stock photo APIs at once; Pexels still wins when both hit
+        pexels = self._executor.submit(self._try_pexels, topic.topic)
+        unsplash = self._executor.submit(self._try_unsplash, topic.topic)
+
+        image = pexels.result() or unsplash.result()
 
-        # Fallback to Unsplash
-        image = self._try_unsplash(topic.topic)
         if image:
             image.alt_text = alt_text
             return image
@@ -51,73 +87,120 @@ class ImageHandler:
 
     def _try_pexels(self, query: str) -> Optional[ImageMetadata]:
         """Try to get image from Pexels API."""
-        try:
-            headers = {"Authorization": self.settings.pexels_api_key}
-            params = {
-                "query": query,
-                "per_page": 1,
-                "orientation": "landscape"
-            }
-
-            response = requests.get(
-                "https://api.pexels.com/v1/search",
-                headers=headers,
-                params=params,
-                timeout=10
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            if data.get("photos") and len(data["photos"]) > 0:
-                photo = data["photos"][0]
-                logger.info(f"Found Pexels image: {photo['url']}")
+        return self._cached_search("Pexels", query, self._search_pexels)
+
+    @retry(
+        stop=stop_after_attempt(2),
+        wait=wait_exponential(min=1, max=4),
+        retry=retry_if_exception(is_transient_error),
+        reraise=True
+    )
+    def _search_pexels(self, query: str) -> Optional[ImageMetadata]:
+        """Search Pexels for a landscape photo, raising on HTTP errors."""
+        headers = {"Authorization": self.settings.pexels_api_key}
+        params = {
+            "query": query,
+            "per_page": 1,
+            "orientation": "landscape"
+        }
+
+        response = self.session.get(
+            "https://api.pexels.com/v1/search",
+            headers=headers,
+            params=params,
+            timeout=10
+        )
+        response.raise_for_status()
+
+        data = response.json()
+        if data.get("photos") and len(data["photos"]) > 0:
+            photo = data["photos"][0]
+            logger.info(f"Found Pexels image: {photo['url']}")
 
-                return ImageMetadata(
-                    url=photo["src"]["large"],
-                    source="pexels",
-                    alt_text="",  # Will be set by caller
-                    photographer=photo.get("photographer"),
-                    photographer_url=photo.get("photographer_url")
-                )
-
-        except Exception as e:
-            logger.warning(f"Pexels API failed: {e}")
+            return ImageMetadata(
+                url=photo["src"]["large"],
+                source="pexels",
+                alt_text="",  # Will be set by caller
+                photographer=photo.get("photographer"),
+                photographer_url=photo.get("photographer_url")
+            )
 
         return None
 
     def _try_unsplash(self, query: str) -> Optional[ImageMetadata]:
         """Try to get image from Unsplash API."""
-        try:
-            headers = {"Authorization": f"Client-ID {self.settings.unsplash_access_key}"}
-            params = {
-                "query": query,
-                "per_page": 1,
-                "orientation": "landscape"
-            }
-
-            response = requests.get(
-                "https://api.unsplash.com/search/photos",
-                headers=headers,
-                params=params,
-                timeout=10
-            )
-            response.raise_for_status()
+        return self._cached_search("Unsplash", query, self._search_unsplash)
+
+    def _cached_search(
+        self,
+        provider: str,
+        query: str,
+        search: Callable[[str], Optional[ImageMetadata]]
+    ) -> Optional[ImageMetadata]:
+        """
+        Run a stock photo search, reusing recent results for the same query.
 
-            data = response.json()
-            if data.get("results") and len(data["results"]) > 0:
-                photo = data["results"][0]
-                logger.info(f"Found Unsplash image: {photo['urls']['regular']}")
+        Empty results are cached too; failed searches are not.
 
-                return ImageMetadata(
-                    url=photo["urls"]["regular"],
-                    source="unsplash",
-                    alt_text="",  # Will be set by caller
-                    photographer=photo["user"].get("name"),
-                    photographer_url=photo["user"].get("links", {}).get("html")
-                )
+        Args:
+            provider: Provider name, used in the cache key and log messages
+            query: Search query
+            search: Raising search function for the provider
 
-        except Exception as e:
-            logger.warning(f"Unsplash API failed: {e}")
+        Returns:
+            A fresh ImageMetadata copy, or None if nothing was found
+        """
+        key = (provider, query)
+        image = self._search_cache.get(key, _MISSING)
+
+        if image is _MISSING:
+            try:
+                image = search(query)
+            except Exception as e:
+                logger.warning(f"{provider} API failed: {e}")
+                return None
+            self._search_cache.set(key, image)
+        else:
+            logger.debug(f"Using cached {provider} result for: {query}")
+
+        # Callers set alt_text on the result, so never hand out the cached object
+        return image.model_copy() if image else None
+
+    @retry(
+        stop=stop_after_attempt(2),
+        wait=wait_exponential(min=1, max=4),
+        retry=retry_if_exception(is_transient_error),
+        reraise=True
+    )
+    def _search_unsplash(self, query: str) -> Optional[ImageMetadata]:
+        """Search Unsplash for a landscape photo, raising on HTTP errors."""
+        headers = {"Authorization": f"Client-ID {self.settings.unsplash_access_key}"}
+        params = {
+            "query": query,
+            "per_page": 1,
+            "orientation": "landscape"
+        }
+
+        response = self.session.get(
+            "https://api.unsplash.com/search/photos",
+            headers=headers,
+            params=params,
+            timeout=10
+        )
+        response.raise_for_status()
+
+        data = response.json()
+        if data.get("results") and len(data["results"]) > 0:
+            photo = data["results"][0]
+            logger.info(f"Found Unsplash image: {photo['urls']['regular']}")
+
+            return ImageMetadata(
+                url=photo["urls"]["regular"],
+                source="unsplash",
+                alt_text="",  # Will be set by caller
+                photographer=photo["user"].get("name"),
+                photographer_url=photo["user"].get("links", {}).get("html")
+            )
 
         return None
 
@@ -125,16 +208,7 @@ class ImageHandler:
         """Generate image using DALL-E 3."""
         try:
             # Create descriptive prompt for DALL-E
-            prompt = f"""Professional, high-quality photograph for a blog about {topic.topic} for a {topic.business_type} in {topic.location}.
-
-Style: Clean, modern, professional photography
-Mood: Trustworthy and welcoming
-Lighting: Natural, well-lit
-Composition: Landscape orientation, suitable for blog featured image
-
-{alt_text}
-
-No text, no people's faces, no logos."""
+            prompt = _DALLE_PROMPT.format(topic=topic, alt_text=alt_text)
 
             logger.info("Generating DALL-E 3 image...")
 
@@ -172,11 +246,23 @@ No text, no people's faces, no logos."""
             Image bytes if successful, None otherwise
         """
         try:
-            response = requests.get(image.url, timeout=30)
-            response.raise_for_status()
-
-            logger.info(f"Downloaded image: {len(response.content)} bytes")
-            return response.content
+            # Stream into one growing buffer instead of holding the raw
+            # response body and a copy of it at the same time
+            with self.session.get(image.url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+
+                content_length = int(response.headers.get("Content-Length") or 0)
+                if content_length > self.MAX_IMAGE_BYTES:
+                    raise ValueError(f"image too large ({content_length} bytes)")
+
+                buffer = bytearray()
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    buffer.extend(chunk)
+                    if len(buffer) > self.MAX_IMAGE_BYTES:
+                        raise ValueError(f"image exceeds {self.MAX_IMAGE_BYTES} bytes")
+
+            logger.info(f"Downloaded image: {len(buffer)} bytes")
+            return bytes(buffer)
 
         except Exception as e:
             logger.error(f"Failed to download image: {e}")
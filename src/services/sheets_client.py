@@ -1,7 +1,10 @@
 """Google Sheets integration for reading topics and logging results."""
 
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from functools import cached_property, lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
 import gspread
+from gspread.utils import rowcol_to_a1
 from google.oauth2.service_account import Credentials
 from loguru import logger
 
@@ -9,6 +12,22 @@ from src.models.blog_post import BlogTopic, PostLog
 from src.models.config import get_settings
 
 
+# Topic rows in any of these states have already been picked up
+_SKIP_STATUSES = frozenset({"completed", "processing", "failed"})
+
+# "Started At" cells, written in UTC alongside each Processing status
+_STARTED_AT_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Smallest window read by _iter_topic_rows; most sheets fit in one request
+_MIN_TOPIC_WINDOW = 500
+
+
+@lru_cache(maxsize=4)
+def _load_credentials(path: str, scopes: Tuple[str, ...]) -> Credentials:
+    """Load service-account credentials once per (file, scopes) pair."""
+    return Credentials.from_service_account_file(path, scopes=list(scopes))
+
+
 class SheetsClient:
     """Google Sheets client for data management."""
 
@@ -21,15 +40,30 @@ class SheetsClient:
     def __init__(self):
         """Initialize Google Sheets client."""
         self.settings = get_settings()
-        self.client = self._authenticate()
-        self.sheet = self.client.open_by_key(self.settings.google_sheet_id)
+
+        # Worksheet handles and the Topics header row, resolved once per client
+        self._worksheets: Dict[str, gspread.Worksheet] = {}
+        self._headers: Optional[List[str]] = None
+
+        # Logs rows from a failed flush(), retried by the next flush_logs()
+        self._pending_logs: List[List[str]] = []
+
+    @cached_property
+    def client(self) -> gspread.Client:
+        """Authorized gspread client, created on first use."""
+        return self._authenticate()
+
+    @cached_property
+    def sheet(self) -> gspread.Spreadsheet:
+        """Target spreadsheet, opened on first use."""
+        return self.client.open_by_key(self.settings.google_sheet_id)
 
     def _authenticate(self) -> gspread.Client:
         """Authenticate with Google Sheets API."""
         try:
-            credentials = Credentials.from_service_account_file(
+            credentials = _load_credentials(
                 self.settings.google_sheets_credentials_file,
-                scopes=self.SCOPES
+                tuple(self.SCOPES)
             )
             return gspread.authorize(credentials)
         except Exception as e:
@@ -46,17 +80,24 @@ class SheetsClient:
             limit: Maximum number of topics to retrieve
 
         Returns:
-            List of BlogTopic objects where Status is empty or 'Pending'
+            List of BlogTopic objects where Status is empty or 'Pending', or
+            'Processing' for longer than PROCESSING_TIMEOUT_MINUTES
         """
         try:
-            worksheet = self.sheet.worksheet("Topics")  # Input sheet name
-            all_records = worksheet.get_all_records()
+            worksheet = self._ws("Topics")  # Input sheet name
 
             topics = []
-            for idx, row in enumerate(all_records, start=2):  # Start at 2 (row 1 is headers)
-                # Skip if already processed
-                status = row.get("Status", "").strip().lower()
-                if status in ["completed", "processing", "failed"]:
+            for idx, row in self._iter_topic_rows(worksheet, limit):
+                # Skip if already processed, unless a crashed run left it in Processing
+                status = str(row.get("Status", "")).strip().casefold()
+                if status == "processing" and self._is_stale(row):
+                    logger.warning(f"Retrying row {idx}: stuck in Processing")
+                elif status in _SKIP_STATUSES:
+                    continue
+
+                # Blank or half-filled rows must not be published anywhere
+                if not str(row.get("Topic", "")).strip() or not str(row.get("Site Domain", "")).strip():
+                    logger.warning(f"Skipping row {idx}: Topic and Site Domain are required")
                     continue
 
                 try:
@@ -80,6 +121,74 @@ class SheetsClient:
             logger.error(f"Failed to read topics from sheet: {e}")
             return []
 
+    def _is_stale(self, row: dict) -> bool:
+        """Check whether a Processing row started longer ago than the timeout."""
+        try:
+            started_at = datetime.strptime(
+                str(row.get("Started At", "")).strip(), _STARTED_AT_FORMAT
+            ).replace(tzinfo=timezone.utc)
+        except ValueError:
+            # No usable start time (older runs, or edited by hand)
+            return True
+
+        timeout = timedelta(minutes=self.settings.processing_timeout_minutes)
+        return datetime.now(timezone.utc) - started_at > timeout
+
+    @staticmethod
+    def _iter_topic_rows(
+        worksheet: gspread.Worksheet,
+        limit: Optional[int]
+    ) -> Iterator[Tuple[int, dict]]:
+        """
+        Yield (row_number, row dict) pairs from the Topics sheet.
+
+        Without a limit the whole sheet is read at once. With a limit, rows are
+        fetched in growing windows of at least ``limit * 4`` rows, so a small
+        batch never downloads a large sheet; iteration ends once the caller
+        has enough topics, a whole window is blank, or the sheet's last row
+        has been read. Blank rows are never yielded.
+
+        Args:
+            worksheet: Topics worksheet
+            limit: Maximum number of topics the caller needs
+
+        Yields:
+            Tuples of (sheet row number, dict keyed by header)
+        """
+        if not limit:
+            # Start at 2 (row 1 is headers)
+            for row_number, record in enumerate(worksheet.get_all_records(), start=2):
+                if any(str(value).strip() for value in record.values()):
+                    yield row_number, record
+            return
+
+        headers: Optional[List[str]] = None
+        start, window = 1, max(limit * 4, _MIN_TOPIC_WINDOW) + 1
+        while start <= worksheet.row_count:
+            end = start + window - 1
+            values = worksheet.get_values(f"{start}:{end}")
+
+            first_row = start
+            if headers is None:
+                if not values or not any(values[0]):
+                    return
+                headers, values = values[0], values[1:]
+                first_row += 1
+
+            # An empty range comes back as [[]]; blank rows inside a window as []
+            found = False
+            for offset, cells in enumerate(values):
+                if any(cells):
+                    found = True
+                    yield first_row + offset, dict(zip(headers, cells))
+
+            # The API omits trailing empty rows, so a short window only means it
+            # ended in blank rows; more topics may follow below them. A window
+            # with no rows at all is past the end of the data.
+            if not found:
+                return
+            start, window = end + 1, window * 2
+
     def mark_topic_status(self, row_number: int, status: str, post_url: Optional[str] = None):
         """
         Update topic status in the sheet.
@@ -89,40 +198,16 @@ class SheetsClient:
             status: New status (Processing/Completed/Failed)
             post_url: Published post URL (optional)
         """
-        try:
-            worksheet = self.sheet.worksheet("Topics")
-
-            # Find Status column (usually column F)
-            headers = worksheet.row_values(1)
-            try:
-                status_col = headers.index("Status") + 1
-            except ValueError:
-                logger.warning("Status column not found, adding it")
-                status_col = len(headers) + 1
-                worksheet.update_cell(1, status_col, "Status")
-
-            # Update status
-            worksheet.update_cell(row_number, status_col, status)
-
-            # If post URL provided, add it to Post URL column
-            if post_url:
-                try:
-                    url_col = headers.index("Post URL") + 1
-                except ValueError:
-                    url_col = len(headers) + 2
-                    worksheet.update_cell(1, url_col, "Post URL")
-
-                worksheet.update_cell(row_number, url_col, post_url)
-
+        if self._write_statuses([(row_number, status, post_url)]):
             logger.info(f"Updated row {row_number}: {status}")
 
-        except Exception as e:
-            logger.error(f"Failed to update topic status: {e}")
-
     def log_post_result(self, post_log: PostLog):
         """
         Log post result to the Logs worksheet.
 
+        The row is written immediately; use flush() to log many results
+        with one request.
+
         Args:
             post_log: PostLog object with result data
         """
@@ -130,35 +215,167 @@ class SheetsClient:
             return
 
         try:
-            # Get or create Logs worksheet
-            try:
-                log_worksheet = self.sheet.worksheet("Logs")
-            except gspread.exceptions.WorksheetNotFound:
-                logger.info("Creating Logs worksheet")
-                log_worksheet = self.sheet.add_worksheet("Logs", rows=1000, cols=10)
+            log_worksheet = self._get_logs_worksheet()
+            log_worksheet.append_row(post_log.to_sheet_row(), value_input_option="RAW")
+            logger.debug(f"Logged result for: {post_log.post_title}")
 
-                # Add headers
-                headers = [
-                    "Date", "Site", "Topic", "Post Title",
-                    "Post URL", "Word Count", "Status", "Error"
-                ]
-                log_worksheet.update('A1:H1', [headers])
+        except Exception as e:
+            logger.error(f"Failed to log to sheet: {e}")
 
-            # Append log row
-            log_worksheet.append_row(post_log.to_sheet_row())
-            logger.debug(f"Logged result for: {post_log.post_title}")
+    def flush_logs(self):
+        """Append all buffered log rows to the Logs worksheet in one request."""
+        if not self._pending_logs:
+            return
+
+        rows, self._pending_logs = self._pending_logs, []
+        try:
+            log_worksheet = self._get_logs_worksheet()
+            log_worksheet.append_rows(rows, value_input_option="RAW")
+            logger.debug(f"Logged {len(rows)} results")
 
         except Exception as e:
+            # Keep the rows so the next flush retries them
+            self._pending_logs[:0] = rows
             logger.error(f"Failed to log to sheet: {e}")
 
+    def flush(
+        self,
+        status_updates: List[Tuple[int, str, Optional[str]]],
+        post_logs: List[PostLog]
+    ) -> List[Tuple[int, str, Optional[str]]]:
+        """
+        Write many status updates and log rows with as few API calls as possible.
+
+        All status/URL cells go out in a single ``values.batchUpdate`` request
+        and all log rows in a single append. Log rows that fail are kept for
+        the next flush; failed status updates are handed back to the caller.
+
+        Args:
+            status_updates: (row_number, status, post_url) tuples for the Topics sheet
+            post_logs: PostLog objects to append to the Logs sheet
+
+        Returns:
+            Status updates that could not be written
+        """
+        failed: List[Tuple[int, str, Optional[str]]] = []
+        if status_updates:
+            if self._write_statuses(status_updates):
+                logger.info(f"Updated {len(status_updates)} topic statuses")
+            else:
+                failed = status_updates
+
+        # Also retries rows kept from an earlier failed flush
+        if self.settings.log_to_sheet:
+            self._pending_logs.extend(post_log.to_sheet_row() for post_log in post_logs)
+            self.flush_logs()
+
+        return failed
+
+    def _ws(self, name: str) -> gspread.Worksheet:
+        """
+        Get a worksheet handle by title, resolving it only on first use.
+
+        Raises:
+            gspread.exceptions.WorksheetNotFound: If the worksheet does not exist
+        """
+        worksheet = self._worksheets.get(name)
+        if worksheet is None:
+            worksheet = self._worksheets[name] = self.sheet.worksheet(name)
+        return worksheet
+
+    def invalidate_cache(self):
+        """Forget cached worksheet handles and headers (e.g. after sheets are renamed)."""
+        self._worksheets.clear()
+        self._headers = None
+
+    def _topics_headers(self) -> List[str]:
+        """Get the Topics header row, fetched once per client."""
+        if self._headers is None:
+            self._headers = self._ws("Topics").row_values(1)
+        return self._headers
+
+    def _write_statuses(self, status_updates: List[Tuple[int, str, Optional[str]]]) -> bool:
+        """
+        Write status/URL cells to the Topics sheet in one batch request.
+
+        Missing Status/Post URL/Started At header cells are added in the same
+        request. A Processing status also records its start time, so rows left
+        behind by a crashed run can be retried later.
+
+        Args:
+            status_updates: (row_number, status, post_url) tuples
+
+        Returns:
+            True if the write succeeded, False otherwise
+        """
+        try:
+            headers = self._topics_headers()
+            data = []
+            started_at = datetime.now(timezone.utc).strftime(_STARTED_AT_FORMAT)
+
+            def column(name: str) -> int:
+                if name not in headers:
+                    logger.warning(f"{name} column not found, adding it")
+                    headers.append(name)
+                    data.append({
+                        "range": f"Topics!{rowcol_to_a1(1, len(headers))}",
+                        "values": [[name]]
+                    })
+                return headers.index(name) + 1
+
+            for row_number, status, post_url in status_updates:
+                data.append({
+                    "range": f"Topics!{rowcol_to_a1(row_number, column('Status'))}",
+                    "values": [[status]]
+                })
+                if post_url:
+                    data.append({
+                        "range": f"Topics!{rowcol_to_a1(row_number, column('Post URL'))}",
+                        "values": [[post_url]]
+                    })
+                if status == "Processing":
+                    data.append({
+                        "range": f"Topics!{rowcol_to_a1(row_number, column('Started At'))}",
+                        "values": [[started_at]]
+                    })
+
+            self.sheet.values_batch_update({
+                "valueInputOption": "RAW",
+                "data": data
+            })
+            return True
+
+        except Exception as e:
+            # The sheet may have changed underneath us; re-resolve it next time
+            self.invalidate_cache()
+            logger.error(f"Failed to update topic status: {e}")
+            return False
+
+    def _get_logs_worksheet(self) -> gspread.Worksheet:
+        """Get the Logs worksheet, creating it with headers if missing."""
+        try:
+            return self._ws("Logs")
+        except gspread.exceptions.WorksheetNotFound:
+            logger.info("Creating Logs worksheet")
+            log_worksheet = self.sheet.add_worksheet("Logs", rows=1000, cols=10)
+            self._worksheets["Logs"] = log_worksheet
+
+            # Add headers
+            headers = [
+                "Date", "Site", "Topic", "Post Title",
+                "Post URL", "Word Count", "Status", "Error"
+            ]
+            log_worksheet.update('A1:H1', [headers])
+            return log_worksheet
+
     def create_template_sheet(self):
         """Create template worksheets with proper headers."""
         try:
             # Create Topics worksheet
             try:
-                topics_ws = self.sheet.worksheet("Topics")
+                self._ws("Topics")
             except gspread.exceptions.WorksheetNotFound:
-                topics_ws = self.sheet.add_worksheet("Topics", rows=100, cols=7)
+                self._worksheets["Topics"] = self.sheet.add_worksheet("Topics", rows=100, cols=8)
 
             topics_headers = [
                 "Topic",
@@ -167,21 +384,30 @@ class SheetsClient:
                 "Internal Link URLs",
                 "Site Domain",
                 "Status",
-                "Post URL"
+                "Post URL",
+                "Started At"
             ]
-            topics_ws.update('A1:G1', [topics_headers])
 
             # Create Logs worksheet
             try:
-                logs_ws = self.sheet.worksheet("Logs")
+                self._ws("Logs")
             except gspread.exceptions.WorksheetNotFound:
-                logs_ws = self.sheet.add_worksheet("Logs", rows=1000, cols=8)
+                self._worksheets["Logs"] = self.sheet.add_worksheet("Logs", rows=1000, cols=8)
 
             logs_headers = [
                 "Date", "Site", "Topic", "Post Title",
                 "Post URL", "Word Count", "Status", "Error"
             ]
-            logs_ws.update('A1:H1', [logs_headers])
+
+            # Write both header rows in one request
+            self.sheet.values_batch_update({
+                "valueInputOption": "RAW",
+                "data": [
+                    {"range": "Topics!A1:G1", "values": [topics_headers]},
+                    {"range": "Logs!A1:H1", "values": [logs_headers]}
+                ]
+            })
+            self._headers = topics_headers
 
             logger.info("Template sheets created successfully")
 
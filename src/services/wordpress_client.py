@@ -1,36 +1,217 @@
 """WordPress REST API client for publishing posts."""
 
 import base64
-from typing import Optional, List, Dict
+import gzip
+import hashlib
+import html
+import io
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache
+from typing import BinaryIO, Optional, List, Dict, Tuple, Union
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
 from loguru import logger
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
 from src.models.blog_post import BlogPost, ImageMetadata
 from src.models.config import WordPressSite
+from src.utils.cache import DiskCache
+from src.utils.http import is_transient_error
+
+
+# Featured image to upload: raw bytes, a file path, or an open binary file
+ImageSource = Union[bytes, str, BinaryIO]
+
+
+def _is_unsent(exc: BaseException) -> bool:
+    """Retry only failures where the server cannot have acted: 429 and connection setup."""
+    if isinstance(exc, requests.exceptions.HTTPError) and exc.response is not None:
+        return exc.response.status_code == 429
+    if isinstance(exc, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(exc, requests.exceptions.ConnectionError) and exc.args:
+        # requests wraps urllib3's MaxRetryError; its reason says what failed
+        return isinstance(getattr(exc.args[0], "reason", None), NewConnectionError)
+    return False
+
+
+# Shared retry policies; jitter keeps concurrent uploads from retrying in lockstep
+_retry_transient = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential_jitter(initial=2, max=30, jitter=2),
+    retry=retry_if_exception(is_transient_error),
+    reraise=True
+)
+_retry_unsent = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential_jitter(initial=2, max=30, jitter=2),
+    retry=retry_if_exception(_is_unsent),
+    reraise=True
+)
+
+
+# Leading magic bytes -> file extension; WebP also carries "WEBP" at offset 8
+_IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", "jpg"),
+    (b"\x89PNG", "png"),
+    (b"GIF8", "gif"),
+    (b"RIFF", "webp"),
+)
+
+
+def _image_extension(image_source: "ImageSource") -> str:
+    """
+    Detect the image format from its first bytes, not from the source URL.
+
+    Args:
+        image_source: Image bytes, a file path, or a binary file object
+
+    Returns:
+        File extension, "jpg" when the format is not recognized
+    """
+    if isinstance(image_source, (bytes, bytearray)):
+        head = bytes(image_source[:12])
+    elif isinstance(image_source, str):
+        with open(image_source, "rb") as f:
+            head = f.read(12)
+    elif image_source.seekable():
+        start = image_source.tell()
+        head = image_source.read(12)
+        image_source.seek(start)
+    else:
+        return "jpg"
+
+    for signature, ext in _IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            if ext == "webp" and head[8:12] != b"WEBP":
+                break
+            return ext
+    return "jpg"
+
+
+def _content_digest(image_source: "ImageSource") -> str:
+    """
+    Hash image content so identical images map to one media ID.
+
+    Files are hashed in chunks and rewound, so they can still be streamed
+    to the upload afterwards.
+
+    Args:
+        image_source: Image bytes, a file path, or a seekable binary file object
+
+    Returns:
+        Hex digest
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+
+    if isinstance(image_source, (bytes, bytearray)):
+        hasher.update(image_source)
+        return hasher.hexdigest()
+
+    if isinstance(image_source, str):
+        with open(image_source, "rb") as f:
+            for chunk in iter(lambda: f.read(64 * 1024), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    start = image_source.tell()
+    for chunk in iter(lambda: image_source.read(64 * 1024), b""):
+        hasher.update(chunk)
+    image_source.seek(start)
+    return hasher.hexdigest()
+
+
+@lru_cache(maxsize=32)
+def _basic_auth_header(username: str, app_password: str) -> str:
+    """Build the Basic auth header value once per credential pair."""
+    token = base64.b64encode(f"{username}:{app_password}".encode()).decode()
+    return f"Basic {token}"
 
 
 class WordPressClient:
     """WordPress REST API client for post management."""
 
-    def __init__(self, site: WordPressSite):
+    # Singular names for taxonomy collections, used in log messages
+    TERM_LABELS = {"categories": "category", "tags": "tag"}
+
+    # Upload Content-Type per file extension
+    MEDIA_TYPES = {
+        "jpg": "image/jpeg",
+        "png": "image/png",
+        "gif": "image/gif",
+        "webp": "image/webp"
+    }
+
+    # JSON bodies above this size are gzipped for sites with gzip_requests enabled
+    GZIP_MIN_BYTES = 4096
+
+    # Seconds get_recent_posts trusts its cache before revalidating
+    RECENT_POSTS_TTL = 60
+
+    # Longest Retry-After (seconds) honored before retrying a 429
+    MAX_RETRY_AFTER = 60
+
+    # WordPress rejects batch requests with more sub-requests than this
+    BATCH_MAX_REQUESTS = 25
+
+    # Most-used terms per taxonomy preloaded by warm_caches (REST API maximum)
+    WARM_TERMS_PER_PAGE = 100
+
+    def __init__(self, site: WordPressSite, media_cache_dir: Optional[str] = None):
         """
         Initialize WordPress client for a specific site.
 
         Args:
             site: WordPress site configuration
+            media_cache_dir: Directory that remembers uploaded images across
+                runs, or None to remember them for this client only
         """
         self.site = site
-        self.base_url = site.url.rstrip('/') + '/wp-json/wp/v2'
+        self.api_root = site.url.rstrip('/') + '/wp-json'
+        self.base_url = self.api_root + '/wp/v2'
 
         # Create basic auth header
-        credentials = f"{site.username}:{site.app_password}"
-        token = base64.b64encode(credentials.encode()).decode()
         self.headers = {
-            "Authorization": f"Basic {token}",
+            "Authorization": _basic_auth_header(site.username, site.app_password),
             "Content-Type": "application/json"
         }
 
+        # Keep-alive session so TCP/TLS setup is paid once per site, not per request;
+        # auth and JSON content type are sent by default on every call
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Worker threads for independent requests (image upload, term lookups)
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="wordpress")
+
+        # Lower-cased term name -> ID per taxonomy, shared by all posts on this site
+        self._term_cache: Dict[str, Dict[str, int]] = {"categories": {}, "tags": {}}
+        self._caches_warmed = False
+        self._warm_lock = threading.Lock()
+
+        # Image content digest -> media ID for images already uploaded to this site
+        self._media_cache = DiskCache(media_cache_dir)
+
+        # limit -> (fetched_at, ETag, Last-Modified, posts) for get_recent_posts
+        self._recent_posts: Dict[int, Tuple[float, Optional[str], Optional[str], List[Dict]]] = {}
+
+        # Cleared the first time the site answers 404 on /batch/v1 (WordPress < 5.6)
+        self._batch_supported = True
+
+    def close(self):
+        """Close pooled connections and worker threads held by this client."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+
     def test_connection(self) -> bool:
         """
         Test WordPress connection and authentication.
@@ -39,73 +220,91 @@ class WordPressClient:
             True if connection successful, False otherwise
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/users/me",
-                headers=self.headers,
                 timeout=10
             )
             response.raise_for_status()
 
-            user_data = response.json()
+            user_data = orjson.loads(response.content)
             logger.info(f"Connected to {self.site.name} as {user_data.get('name')}")
             return True
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            # A non-JSON body usually means the REST API is not reachable
+            # at /wp-json (e.g. plain permalinks serving the homepage)
             logger.error(f"WordPress connection failed for {self.site.name}: {e}")
             return False
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30))
     def upload_featured_image(
         self,
-        image_data: bytes,
+        image_source: ImageSource,
         image_metadata: ImageMetadata
     ) -> Optional[int]:
         """
         Upload featured image to WordPress media library.
 
+        The body is streamed from a file handle rather than passed as one
+        bytes object, so a file path never has to be read into memory.
+
         Args:
-            image_data: Image file bytes
+            image_source: Image bytes, a file path, or a binary file object
             image_metadata: Image metadata including alt text
 
         Returns:
             Media ID if successful, None otherwise
         """
         try:
-            # Determine file extension from source or URL
-            ext = "jpg"
-            if "png" in image_metadata.url.lower():
-                ext = "png"
-
-            filename = f"featured-image-{hash(image_metadata.url)}.{ext}"
-
-            # Prepare headers for media upload
+            # A retry must re-send the whole file, so buffer streams that
+            # cannot be rewound
+            if not isinstance(image_source, (bytes, bytearray, str)) and not image_source.seekable():
+                image_source = image_source.read()
+
+            # Identical bytes map to the same filename and cached media ID,
+            # however many posts or URLs the image is reused under
+            digest = _content_digest(image_source)
+            cache_key = DiskCache.make_key(self.site.url, digest)
+            media_id = self._media_cache.get(cache_key)
+            if media_id is not None:
+                logger.debug(f"Reusing uploaded image: media ID {media_id}")
+                return media_id
+
+            ext = _image_extension(image_source)
+            filename = f"featured-image-{digest[:16]}.{ext}"
+
+            # Override the session's JSON content type for the raw upload
             upload_headers = {
-                "Authorization": self.headers["Authorization"],
                 "Content-Disposition": f'attachment; filename="{filename}"',
-                "Content-Type": f"image/{ext}"
+                "Content-Type": self.MEDIA_TYPES[ext]
             }
 
             # Upload image
-            response = requests.post(
-                f"{self.base_url}/media",
-                headers=upload_headers,
-                data=image_data,
-                timeout=30
-            )
-            response.raise_for_status()
+            with ExitStack() as stack:
+                if isinstance(image_source, str):
+                    body = stack.enter_context(open(image_source, "rb"))
+                    upload_headers["Content-Length"] = str(os.path.getsize(image_source))
+                elif isinstance(image_source, (bytes, bytearray)):
+                    body = io.BytesIO(image_source)
+                    upload_headers["Content-Length"] = str(len(image_source))
+                else:
+                    body = image_source
+
+                # Attachment fields ride along as query args on the raw-body
+                # upload, so alt text is set without a second request
+                response = self._post_with_retry(
+                    f"{self.base_url}/media",
+                    rewind_to=body.tell(),
+                    params={"alt_text": image_metadata.alt_text},
+                    headers=upload_headers,
+                    data=body,
+                    timeout=30
+                )
 
-            media_data = response.json()
+            media_data = orjson.loads(response.content)
             media_id = media_data.get("id")
 
-            # Update alt text
             if media_id:
-                alt_text_payload = {"alt_text": image_metadata.alt_text}
-                requests.post(
-                    f"{self.base_url}/media/{media_id}",
-                    headers=self.headers,
-                    json=alt_text_payload,
-                    timeout=10
-                )
+                self._media_cache.set(cache_key, media_id)
 
             logger.info(f"Uploaded image: media ID {media_id}")
             return media_id
@@ -114,74 +313,69 @@ class WordPressClient:
             logger.error(f"Failed to upload image: {e}")
             return None
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30))
-    def create_post(self, blog_post: BlogPost, image_data: Optional[bytes] = None) -> Optional[dict]:
+    def create_post(self, blog_post: BlogPost, image_data: Optional[ImageSource] = None) -> Optional[dict]:
         """
         Create WordPress post with content and featured image.
 
         Args:
             blog_post: Complete blog post data
-            image_data: Featured image bytes (optional)
+            image_data: Featured image bytes, file path or file object (optional)
 
         Returns:
             WordPress post data if successful, None otherwise
         """
         try:
-            # Upload featured image first
-            featured_media_id = None
+            # Upload featured image in the background while terms are resolved
+            image_future = None
             if image_data and blog_post.image:
-                featured_media_id = self.upload_featured_image(
+                image_future = self._executor.submit(
+                    self.upload_featured_image,
                     image_data,
                     blog_post.image
                 )
 
-            # Prepare post payload
-            payload = {
-                "title": blog_post.seo.title,
-                "content": blog_post.content.html_content,
-                "status": blog_post.status,
-                "slug": blog_post.seo.slug,
-                "excerpt": blog_post.seo.meta_description,
-            }
-
-            # Add featured image if uploaded
-            if featured_media_id:
-                payload["featured_media"] = featured_media_id
-
-            # Add categories (create if they don't exist)
+            # Resolve category/tag names to IDs (create if they don't exist)
+            category_ids = tag_ids = None
             if blog_post.categories:
                 category_ids = self._get_or_create_categories(blog_post.categories)
-                payload["categories"] = category_ids
-
-            # Add tags (create if they don't exist)
             if blog_post.tags:
                 tag_ids = self._get_or_create_tags(blog_post.tags)
+
+            featured_media_id = image_future.result() if image_future else None
+
+            # Prepare post payload (title, content, excerpt, meta, featured image)
+            payload = blog_post.to_wordpress_payload(featured_media_id)
+            if category_ids is not None:
+                payload["categories"] = category_ids
+            if tag_ids is not None:
                 payload["tags"] = tag_ids
 
-            # Add Yoast SEO meta if available
-            payload["meta"] = {
-                "description": blog_post.seo.meta_description,
+            # Yoast-specific fields (ignored by sites without Yoast installed)
+            payload["yoast_meta"] = {
+                "yoast_wpseo_title": blog_post.seo.meta_title,
+                "yoast_wpseo_metadesc": blog_post.seo.meta_description,
             }
 
-            # Try to add Yoast-specific fields (will be ignored if Yoast not installed)
-            try:
-                payload["yoast_meta"] = {
-                    "yoast_wpseo_title": blog_post.seo.meta_title,
-                    "yoast_wpseo_metadesc": blog_post.seo.meta_description,
-                }
-            except:
-                pass
-
-            # Create post
-            response = requests.post(
+            # Create post (orjson encodes the large HTML body much faster than json)
+            body = orjson.dumps(payload)
+            post_headers = None
+            if self.site.gzip_requests and len(body) > self.GZIP_MIN_BYTES:
+                body = gzip.compress(body, compresslevel=5)
+                post_headers = {"Content-Encoding": "gzip"}
+
+            # Not idempotent: a timeout after WordPress saved the post must not
+            # create a duplicate, so only unsent requests are retried
+            response = self._create_with_retry(
                 f"{self.base_url}/posts",
-                headers=self.headers,
-                json=payload,
+                headers=post_headers,
+                data=body,
                 timeout=30
             )
-            response.raise_for_status()
 
-            post_data = response.json()
+            post_data = orjson.loads(response.content)
+
+            # A new post changes the recent posts list
+            self._recent_posts.clear()
             logger.info(
                 f"Created post: {post_data.get('title', {}).get('rendered')} "
                 f"(ID: {post_data.get('id')})"
@@ -195,102 +389,374 @@ class WordPressClient:
                 logger.error(f"Response: {e.response.text}")
             return None
 
-    def _get_or_create_categories(self, category_names: List[str]) -> List[int]:
-        """Get or create categories and return their IDs."""
-        category_ids = []
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Failed to create WordPress post: invalid JSON response: {e}")
+            return None
 
-        for name in category_names:
-            try:
-                # Search for existing category
-                response = requests.get(
-                    f"{self.base_url}/categories",
-                    headers=self.headers,
-                    params={"search": name},
-                    timeout=10
-                )
+    @_retry_transient
+    def _post_with_retry(
+        self,
+        url: str,
+        rewind_to: Optional[int] = None,
+        **kwargs
+    ) -> requests.Response:
+        """
+        POST with retries on transient failures, honoring Retry-After on 429.
 
-                categories = response.json()
+        Args:
+            url: Request URL
+            rewind_to: Position to seek a file body back to before each attempt
+            **kwargs: Passed through to session.post
 
-                if categories:
-                    category_ids.append(categories[0]["id"])
-                else:
-                    # Create new category
-                    create_response = requests.post(
-                        f"{self.base_url}/categories",
-                        headers=self.headers,
-                        json={"name": name},
-                        timeout=10
-                    )
-                    category_data = create_response.json()
-                    category_ids.append(category_data["id"])
-                    logger.info(f"Created category: {name}")
+        Returns:
+            Successful response
+        """
+        return self._post(url, rewind_to, **kwargs)
 
-            except Exception as e:
-                logger.warning(f"Failed to process category {name}: {e}")
-                continue
+    @_retry_unsent
+    def _create_with_retry(self, url: str, **kwargs) -> requests.Response:
+        """
+        POST a non-idempotent create, retrying only if the server cannot have acted.
+
+        Args:
+            url: Request URL
+            **kwargs: Passed through to session.post
+
+        Returns:
+            Successful response
+        """
+        return self._post(url, **kwargs)
 
-        return category_ids
+    def _post(self, url: str, rewind_to: Optional[int] = None, **kwargs) -> requests.Response:
+        """Send one POST, waiting out Retry-After on 429 before raising for status."""
+        if rewind_to is not None:
+            kwargs["data"].seek(rewind_to)
+
+        response = self.session.post(url, **kwargs)
+        if response.status_code == 429:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                time.sleep(min(int(retry_after), self.MAX_RETRY_AFTER))
+        response.raise_for_status()
+        return response
+
+    def _get_or_create_categories(self, category_names: List[str]) -> List[int]:
+        """Get or create categories and return their IDs."""
+        return self._get_or_create_terms("categories", category_names)
 
     def _get_or_create_tags(self, tag_names: List[str]) -> List[int]:
         """Get or create tags and return their IDs."""
-        tag_ids = []
+        return self._get_or_create_terms("tags", tag_names)
+
+    def _get_or_create_terms(self, taxonomy: str, names: List[str]) -> List[int]:
+        """
+        Resolve term names to IDs, creating missing terms.
+
+        Existing terms are looked up concurrently; missing ones are created
+        through the REST batch endpoint when the site supports it.
 
-        for name in tag_names:
+        Args:
+            taxonomy: REST collection name ("categories" or "tags")
+            names: Term names
+
+        Returns:
+            IDs of the terms that could be resolved, in input order
+        """
+        if not self._caches_warmed:
+            self.warm_caches()
+
+        label = self.TERM_LABELS[taxonomy]
+        cache = self._term_cache[taxonomy]
+
+        def lookup(name: str) -> Optional[int]:
             try:
-                # Search for existing tag
-                response = requests.get(
-                    f"{self.base_url}/tags",
-                    headers=self.headers,
-                    params={"search": name},
+                return self._find_term(taxonomy, name)
+            except Exception as e:
+                logger.warning(f"Failed to process {label} {name}: {e}")
+                return None
+
+        # Recurring terms are answered from the cache without any request
+        found = {name: cache.get(name.lower()) for name in names}
+        uncached = [name for name, term_id in found.items() if term_id is None]
+        if uncached:
+            found.update(zip(uncached, self._executor.map(lookup, uncached)))
+
+        missing = [name for name, term_id in found.items() if term_id is None]
+        if missing:
+            found.update(self._create_terms(taxonomy, missing))
+
+        for name, term_id in found.items():
+            if term_id is not None:
+                cache[name.lower()] = term_id
+
+        return [found[name] for name in names if found.get(name) is not None]
+
+    def warm_caches(self):
+        """
+        Preload the site's most-used categories and tags into the term cache.
+
+        One GET per taxonomy replaces a search request per term for every
+        term that already exists. Called lazily before the first lookup;
+        on failure, lookups fall back to searching term by term.
+        """
+        with self._warm_lock:
+            if self._caches_warmed:
+                return
+
+            def fetch(taxonomy: str) -> List[Dict]:
+                response = self.session.get(
+                    f"{self.base_url}/{taxonomy}",
+                    params={
+                        "per_page": self.WARM_TERMS_PER_PAGE,
+                        "orderby": "count",
+                        "order": "desc",
+                        "_fields": "id,name"
+                    },
                     timeout=10
                 )
+                response.raise_for_status()
+                return orjson.loads(response.content)
+
+            taxonomies = list(self._term_cache)
+            futures = [self._executor.submit(fetch, taxonomy) for taxonomy in taxonomies]
+            for taxonomy, future in zip(taxonomies, futures):
+                try:
+                    terms = future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to preload {taxonomy} for {self.site.name}: {e}")
+                    continue
+
+                # Names come back HTML-escaped (e.g. "&amp;")
+                cache = self._term_cache[taxonomy]
+                for term in terms:
+                    cache.setdefault(html.unescape(term["name"]).lower(), term["id"])
+                logger.debug(f"Preloaded {len(terms)} {taxonomy} for {self.site.name}")
+
+            self._caches_warmed = True
+
+    def invalidate_term_cache(self):
+        """Forget cached category/tag IDs (e.g. after terms were deleted in WordPress)."""
+        with self._warm_lock:
+            for cache in self._term_cache.values():
+                cache.clear()
+            self._caches_warmed = False
+
+    def _find_term(self, taxonomy: str, name: str) -> Optional[int]:
+        """Search for an existing term; returns its ID or None if not found."""
+        response = self.session.get(
+            f"{self.base_url}/{taxonomy}",
+            params={"search": name, "per_page": 1, "_fields": "id,name"},
+            timeout=10
+        )
+        response.raise_for_status()
+
+        terms = orjson.loads(response.content)
+        return terms[0]["id"] if terms else None
+
+    def _create_terms(self, taxonomy: str, names: List[str]) -> Dict[str, int]:
+        """Create terms, in batches where possible, one request per name otherwise."""
+        created: Dict[str, int] = {}
+        remaining = names
+        if self._batch_supported:
+            created, remaining = self._batch_create_terms(taxonomy, names)
+
+        if remaining:
+            results = self._executor.map(lambda name: self._create_term(taxonomy, name), remaining)
+            created.update(
+                (name, term_id) for name, term_id in zip(remaining, results) if term_id is not None
+            )
+        return created
 
-                tags = response.json()
+    def _batch_create_terms(
+        self,
+        taxonomy: str,
+        names: List[str]
+    ) -> Tuple[Dict[str, int], List[str]]:
+        """
+        Create terms through the WordPress 5.6+ batch endpoint (/batch/v1).
 
-                if tags:
-                    tag_ids.append(tags[0]["id"])
-                else:
-                    # Create new tag
-                    create_response = requests.post(
-                        f"{self.base_url}/tags",
-                        headers=self.headers,
-                        json={"name": name},
-                        timeout=10
-                    )
-                    tag_data = create_response.json()
-                    tag_ids.append(tag_data["id"])
-                    logger.info(f"Created tag: {name}")
+        Args:
+            taxonomy: REST collection name ("categories" or "tags")
+            names: Names of terms to create
+
+        Returns:
+            Tuple of (created names -> IDs, names left unsent because the site
+            turned out to have no batch endpoint)
+        """
+        label = self.TERM_LABELS[taxonomy]
+        created = {}
+
+        for start in range(0, len(names), self.BATCH_MAX_REQUESTS):
+            chunk = names[start:start + self.BATCH_MAX_REQUESTS]
+            try:
+                response = self.session.post(
+                    f"{self.api_root}/batch/v1",
+                    data=orjson.dumps({
+                        "requests": [
+                            {"method": "POST", "path": f"/wp/v2/{taxonomy}", "body": {"name": name}}
+                            for name in chunk
+                        ]
+                    }),
+                    timeout=15
+                )
+                if response.status_code == 404:
+                    logger.info(f"Batch API unavailable on {self.site.name}, creating terms one by one")
+                    self._batch_supported = False
+                    return created, names[start:]
+                response.raise_for_status()
+
+                for name, result in zip(chunk, orjson.loads(response.content).get("responses", [])):
+                    body = result.get("body") or {}
+                    term_id = self._term_id_from_body(body)
+                    if term_id:
+                        created[name] = term_id
+                        logger.info(f"Created {label}: {name}")
+                    else:
+                        logger.warning(f"Failed to create {label} {name}: {body.get('message')}")
 
             except Exception as e:
-                logger.warning(f"Failed to process tag {name}: {e}")
-                continue
+                logger.warning(f"Failed to batch-create {label} terms {chunk}: {e}")
+
+        return created, []
+
+    @staticmethod
+    def _term_id_from_body(body: Dict) -> Optional[int]:
+        """Get the term ID from a create response, including a "term_exists" error."""
+        # A concurrent writer may have created the term first; WordPress then
+        # answers 400 with the existing term's ID in data.term_id
+        return body.get("id") or (body.get("data") or {}).get("term_id")
 
-        return tag_ids
+    def _create_term(self, taxonomy: str, name: str) -> Optional[int]:
+        """Create a single category/tag and return its ID."""
+        label = self.TERM_LABELS[taxonomy]
+
+        try:
+            response = self.session.post(
+                f"{self.base_url}/{taxonomy}",
+                data=orjson.dumps({"name": name}),
+                timeout=10
+            )
+            # 400 may be "term_exists", which still carries a usable ID
+            if response.status_code != 400:
+                response.raise_for_status()
+
+            body = orjson.loads(response.content)
+            term_id = self._term_id_from_body(body)
+            if not term_id:
+                logger.warning(f"Failed to create {label} {name}: {body.get('message')}")
+                return None
+
+            if response.ok:
+                logger.info(f"Created {label}: {name}")
+            return term_id
+
+        except Exception as e:
+            logger.warning(f"Failed to process {label} {name}: {e}")
+            return None
 
     def get_recent_posts(self, limit: int = 10) -> List[Dict]:
         """
         Get recent posts for internal linking analysis.
 
+        Results are reused for RECENT_POSTS_TTL seconds, then revalidated with
+        a conditional GET (If-None-Match / If-Modified-Since) so an unchanged
+        list costs a bodiless 304.
+
         Args:
             limit: Number of recent posts to retrieve
 
         Returns:
             List of post data dictionaries
         """
+        cached = self._recent_posts.get(limit)
+        if cached and time.monotonic() - cached[0] < self.RECENT_POSTS_TTL:
+            return list(cached[3])
+
+        conditional_headers = {}
+        if cached:
+            _, etag, last_modified, _ = cached
+            if etag:
+                conditional_headers["If-None-Match"] = etag
+            if last_modified:
+                conditional_headers["If-Modified-Since"] = last_modified
+
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/posts",
-                headers=self.headers,
-                params={"per_page": limit, "orderby": "date", "order": "desc"},
+                params={
+                    "per_page": limit,
+                    "orderby": "date",
+                    "order": "desc",
+                    # Only what internal linking needs, not rendered content/_links
+                    "_fields": "id,slug,title,link,date"
+                },
+                headers=conditional_headers or None,
                 timeout=15
             )
+
+            if response.status_code == 304 and cached:
+                logger.debug("Recent posts unchanged (304)")
+                self._recent_posts[limit] = (time.monotonic(), *cached[1:])
+                return list(cached[3])
+
             response.raise_for_status()
 
-            posts = response.json()
-            logger.debug(f"Retrieved {len(posts)} recent posts")
+            posts = orjson.loads(response.content)
+            logger.opt(lazy=True).debug("Retrieved {} recent posts", lambda: len(posts))
 
-            return posts
+            self._recent_posts[limit] = (
+                time.monotonic(),
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+                posts
+            )
+            return list(posts)
 
         except Exception as e:
             logger.error(f"Failed to get recent posts: {e}")
             return []
+
+
+def publish_to_sites(
+    clients: List[WordPressClient],
+    blog_post: BlogPost,
+    image_data: Optional[ImageSource] = None
+) -> Dict[str, Optional[dict]]:
+    """
+    Publish the same post to several WordPress sites at once.
+
+    Each client owns its own session and connection pool, so the posts are
+    created in parallel threads and the total time is that of the slowest
+    site rather than the sum of all of them.
+
+    Args:
+        clients: One client per target site
+        blog_post: Complete blog post data
+        image_data: Featured image bytes, file path or file object (optional)
+
+    Returns:
+        Site URL -> WordPress post data, or None where publishing failed
+    """
+    if not clients:
+        return {}
+
+    # A file object cannot be streamed by several threads; read it once
+    if image_data is not None and not isinstance(image_data, (bytes, bytearray, str)):
+        image_data = image_data.read()
+
+    results: Dict[str, Optional[dict]] = {}
+    with ThreadPoolExecutor(
+        max_workers=min(8, len(clients)), thread_name_prefix="publish"
+    ) as executor:
+        futures = {
+            client.site.url: executor.submit(client.create_post, blog_post, image_data)
+            for client in clients
+        }
+        for site_url, future in futures.items():
+            try:
+                results[site_url] = future.result()
+            except Exception as e:
+                logger.error(f"Failed to publish to {site_url}: {e}")
+                results[site_url] = None
+
+    return results
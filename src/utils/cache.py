@@ -0,0 +1,156 @@
+"""Small persistent cache for expensive, repeatable API results."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from loguru import logger
+
+
+class DiskCache:
+    """
+    JSON-file cache with an in-memory layer.
+
+    Values must be JSON-serializable. Each key is stored as one file named
+    by its BLAKE2b digest, written atomically so concurrent writers never
+    leave a partial entry behind. Entries optionally expire after a TTL.
+    """
+
+    def __init__(self, directory: Optional[str], ttl: Optional[float] = None):
+        """
+        Initialize cache.
+
+        Args:
+            directory: Directory for cache files, or None/empty for memory only
+            ttl: Seconds an entry stays valid after it is stored, or None to keep it
+        """
+        self.directory = Path(directory) if directory else None
+        self.ttl = ttl
+        # key -> (expires_at wall-clock time or None, value)
+        self._memory: Dict[str, Tuple[Optional[float], Any]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a stable cache key from string parts."""
+        return hashlib.blake2b("\0".join(parts).encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Cached value, or None on a miss or an expired entry
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+
+        if entry is None and self.directory:
+            try:
+                stored = json.loads((self.directory / f"{key}.json").read_text(encoding="utf-8"))
+                entry = (stored["expires_at"], stored["value"])
+            except FileNotFoundError:
+                return None
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable cache entry {key}: {e}")
+                return None
+
+            with self._lock:
+                self._memory[key] = entry
+
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.time():
+            return None
+        return value
+
+    def set(self, key: str, value: Any):
+        """
+        Store a value in memory and on disk.
+
+        Args:
+            key: Key from make_key()
+            value: JSON-serializable value
+        """
+        expires_at = time.time() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._memory[key] = (expires_at, value)
+
+        if not self.directory:
+            return
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self.directory / f"{key}.json"
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(
+                json.dumps({"expires_at": expires_at, "value": value}), encoding="utf-8"
+            )
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to write cache entry {key}: {e}")
+
+
+class TTLCache:
+    """
+    Thread-safe in-memory cache whose entries expire after a fixed time.
+
+    When full, the least recently stored entry is evicted first.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 3600.0):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Seconds an entry stays valid after it is stored
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Look up an unexpired value.
+
+        Args:
+            key: Cache key
+            default: Returned on a miss or an expired entry
+
+        Returns:
+            Cached value, or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        """
+        Store a value, evicting the oldest entry if the cache is full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
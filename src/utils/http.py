@@ -0,0 +1,10 @@
+"""Shared HTTP helpers for the external API clients."""
+
+import requests
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Retry connection problems, timeouts, 429 and 5xx; not other client errors."""
+    if isinstance(exc, requests.exceptions.HTTPError) and exc.response is not None:
+        return exc.response.status_code == 429 or exc.response.status_code >= 500
+    return isinstance(exc, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
@@ -5,13 +5,19 @@ from loguru import logger
 from pathlib import Path
 
 
-def setup_logger(log_level: str = "INFO", log_file: str = "logs/blog_agent.log"):
+def setup_logger(
+    log_level: str = "INFO",
+    log_file: str = "logs/blog_agent.log",
+    batch_mode: bool = False
+):
     """
     Configure loguru logger with file and console output.
 
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
         log_file: Path to log file
+        batch_mode: Keep the console to plain WARNING+ output; the file
+            still receives everything at log_level
     """
     # Remove default handler
     logger.remove()
@@ -20,25 +26,46 @@ def setup_logger(log_level: str = "INFO", log_file: str = "logs/blog_agent.log")
     log_path = Path(log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Add console handler with color
-    logger.add(
-        sys.stderr,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-        level=log_level,
-        colorize=True
-    )
+    # Add console handler with color. Records are formatted and written on a
+    # background thread (enqueue), and frame introspection for tracebacks
+    # (backtrace/diagnose) is skipped to keep per-record cost low.
+    if batch_mode:
+        console_level = max(logger.level(log_level).no, logger.level("WARNING").no)
+        logger.add(
+            sys.stderr,
+            format="{time:HH:mm:ss} {level} {message}",
+            level=console_level,
+            colorize=False,
+            enqueue=True,
+            backtrace=False,
+            diagnose=False
+        )
+    else:
+        logger.add(
+            sys.stderr,
+            format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
+            level=log_level,
+            colorize=True,
+            enqueue=True,
+            backtrace=False,
+            diagnose=False
+        )
 
-    # Add file handler with rotation
+    # Add file handler with rotation. Enqueued like the console sink, so
+    # rotation and compression run on the logging thread, not the caller's.
     logger.add(
         log_file,
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
         level=log_level,
         rotation="10 MB",  # Rotate when file reaches 10MB
         retention="30 days",  # Keep logs for 30 days
-        compression="zip"  # Compress rotated logs
+        compression="gz",  # Compress rotated logs (gzip is faster than zip)
+        enqueue=True,
+        backtrace=False,
+        diagnose=False
     )
 
-    logger.info(f"Logger initialized: level={log_level}, file={log_file}")
+    logger.info(f"Logger initialized: level={log_level}, file={log_file}, batch_mode={batch_mode}")
 
 
 def get_logger():
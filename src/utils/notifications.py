@@ -1,28 +1,55 @@
 """Notification utilities for Telegram and Slack."""
 
+import atexit
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple
+
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
 from loguru import logger
 
 from src.models.config import get_settings
 
 
 class NotificationService:
-    """Send notifications via Telegram or Slack."""
+    """
+    Send notifications via Telegram or Slack.
+
+    Messages are queued and delivered by a background thread, so sending
+    never blocks the publishing pipeline. Call flush() to wait for delivery.
+    """
+
+    # Successes arriving within this many seconds are sent as one message
+    COALESCE_WINDOW = 2.0
 
     def __init__(self):
         """Initialize notification service."""
         self.settings = get_settings()
 
+        self._channels: List[Callable[[str], None]] = []
+        if self.settings.telegram_bot_token and self.settings.telegram_chat_id:
+            self._channels.append(self._send_telegram)
+        if self.settings.slack_webhook_url:
+            self._channels.append(self._send_slack)
+
+        self._queue: "queue.Queue[Tuple[str, str]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # Keep-alive connections to api.telegram.org and the Slack webhook host
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+
     def send_success(self, site: str, post_title: str, post_url: str):
         """Send success notification."""
-        message = f"""✅ Post Published Successfully
-
-Site: {site}
+        self._enqueue("success", f"""Site: {site}
 Title: {post_title}
-URL: {post_url}"""
-
-        self._send(message)
+URL: {post_url}""")
 
     def send_failure(self, site: str, topic: str, error: str):
         """Send failure notification."""
@@ -32,7 +59,7 @@ Site: {site}
 Topic: {topic}
 Error: {error}"""
 
-        self._send(message)
+        self._enqueue("message", message)
 
     def send_batch_summary(self, stats: dict):
         """Send batch processing summary."""
@@ -42,17 +69,74 @@ Total: {stats['total']}
 ✅ Success: {stats['success']}
 ❌ Failed: {stats['failed']}"""
 
-        self._send(message)
+        self._enqueue("message", message)
+
+    def flush(self):
+        """Block until every queued notification has been delivered."""
+        if self._worker is not None:
+            self._queue.join()
+
+    def _enqueue(self, kind: str, text: str):
+        """Queue a notification, starting the delivery thread on first use."""
+        if not self._channels:
+            return
+
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="notifications", daemon=True
+                )
+                self._worker.start()
+                # Deliver whatever is still queued when the process exits
+                atexit.register(self.flush)
+
+        self._queue.put((kind, text))
+
+    def _run(self):
+        """Delivery loop: coalesce bursts of successes, send everything else as-is."""
+        carry: Optional[Tuple[str, str]] = None
+
+        while True:
+            kind, text = carry or self._queue.get()
+            carry = None
+
+            if kind != "success":
+                self._send(text)
+                self._queue.task_done()
+                continue
+
+            successes = [text]
+            deadline = time.monotonic() + self.COALESCE_WINDOW
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item[0] != "success":
+                    carry = item
+                    break
+                successes.append(item[1])
+
+            if len(successes) == 1:
+                header = "✅ Post Published Successfully"
+            else:
+                header = f"✅ {len(successes)} Posts Published Successfully"
+            self._send(header + "\n\n" + "\n\n".join(successes))
+
+            for _ in successes:
+                self._queue.task_done()
 
     def _send(self, message: str):
-        """Send message to configured channels."""
-        # Try Telegram
-        if self.settings.telegram_bot_token and self.settings.telegram_chat_id:
-            self._send_telegram(message)
-
-        # Try Slack
-        if self.settings.slack_webhook_url:
-            self._send_slack(message)
+        """Send message to configured channels (Telegram and Slack in parallel)."""
+        if len(self._channels) == 1:
+            self._channels[0](message)
+            return
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=len(self._channels), thread_name_prefix="notify"
+            )
+        list(self._executor.map(lambda send: send(message), self._channels))
 
     def _send_telegram(self, message: str):
         """Send Telegram notification."""
@@ -64,7 +148,7 @@ Total: {stats['total']}
                 "parse_mode": "Markdown"
             }
 
-            response = requests.post(url, json=payload, timeout=10)
+            response = self.session.post(url, json=payload, timeout=10)
             response.raise_for_status()
 
             logger.debug("Telegram notification sent")
@@ -77,7 +161,7 @@ Total: {stats['total']}
         try:
             payload = {"text": message}
 
-            response = requests.post(
+            response = self.session.post(
                 self.settings.slack_webhook_url,
                 json=payload,
                 timeout=10
@@ -88,3 +172,14 @@ Total: {stats['total']}
 
         except Exception as e:
             logger.warning(f"Failed to send Slack notification: {e}")
+
+
+@lru_cache(maxsize=1)
+def get_notification_service() -> NotificationService:
+    """
+    Get or create the notification service singleton.
+
+    Scheduled runs reuse one delivery thread and HTTP session instead of
+    starting new ones for every batch.
+    """
+    return NotificationService()
@@ -0,0 +1,71 @@
+"""Text statistics for generated HTML blog content."""
+
+import re
+from html.parser import HTMLParser
+from typing import List, Optional
+
+# Compiled once at import; these run on every generated post
+_WORD_RE = re.compile(r'\w+')
+# Any run of non-word characters or underscores; Unicode letters are kept
+_SLUG_RE = re.compile(r'[\W_]+')
+
+_HEADING_TAGS = frozenset({'h2', 'h3'})
+
+
+class HtmlStatsParser(HTMLParser):
+    """
+    Collects word count, H2/H3 headings and link targets in one pass.
+
+    HTML may be fed in arbitrary chunks (e.g. as it streams in); results
+    are complete once close() has been called.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.word_count = 0
+        self.headings: List[str] = []
+        self.links: List[str] = []
+        self._heading_parts: Optional[List[str]] = None
+        # Text since the last tag; a text node can arrive split across feeds
+        self._text: List[str] = []
+
+    def _count_text(self):
+        if self._text:
+            text = ''.join(self._text)
+            self._text.clear()
+            # Count matches without materializing a list of every word
+            self.word_count += sum(1 for _ in _WORD_RE.finditer(text))
+
+    def handle_starttag(self, tag, attrs):
+        self._count_text()
+        if tag in _HEADING_TAGS:
+            self._heading_parts = []
+        elif tag == 'a':
+            href = dict(attrs).get('href')
+            if href:
+                self.links.append(href)
+
+    def handle_endtag(self, tag):
+        self._count_text()
+        if tag in _HEADING_TAGS and self._heading_parts is not None:
+            self.headings.append(''.join(self._heading_parts).strip())
+            self._heading_parts = None
+
+    def handle_data(self, data):
+        self._text.append(data)
+        if self._heading_parts is not None:
+            self._heading_parts.append(data)
+
+    def close(self):
+        super().close()
+        self._count_text()
+
+
+def slugify(text: str) -> str:
+    """
+    Normalize text to a lowercase, hyphen-separated URL slug.
+
+    Accented and non-Latin letters are kept (WordPress percent-encodes
+    them). An empty result lets WordPress derive the slug from the title.
+    """
+    return _SLUG_RE.sub('-', text.lower()).strip('-')
@@ -0,0 +1,93 @@
+"""Tests for reading pending topics from the Topics worksheet."""
+
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from src.services.sheets_client import SheetsClient
+
+HEADERS = ["Topic", "Site Domain", "Status"]
+
+
+def make_worksheet(rows, row_count=1000):
+    """
+    Fake Topics worksheet that answers get_values like the Sheets API.
+
+    Args:
+        rows: Sheet rows starting at row 1 (the header row)
+        row_count: Grid size reported by the worksheet
+
+    Returns:
+        Mock worksheet
+    """
+    worksheet = mock.MagicMock()
+    worksheet.row_count = row_count
+
+    def get_values(a1_range):
+        start, end = map(int, a1_range.split(":"))
+        values = [list(row) for row in rows[start - 1:end]]
+        # Trailing empty rows are omitted; an empty range comes back as [[]]
+        while values and not any(values[-1]):
+            values.pop()
+        return values or [[]]
+
+    worksheet.get_values.side_effect = get_values
+    return worksheet
+
+
+def make_client(worksheet):
+    """SheetsClient whose Topics worksheet is the given fake."""
+    client = SheetsClient.__new__(SheetsClient)
+    client._worksheets = {"Topics": worksheet}
+    return client
+
+
+def test_all_completed_sheet_has_no_pending_topics():
+    rows = [HEADERS] + [[f"Topic {i}", "example.com", "Completed"] for i in range(10)]
+    worksheet = make_worksheet(rows)
+
+    assert make_client(worksheet).get_pending_topics(limit=1) == []
+    # The empty window after the data ends the scan
+    assert worksheet.get_values.call_count == 2
+
+
+def test_empty_window_yields_no_rows():
+    rows = [HEADERS, ["Topic 1", "example.com", "Completed"]]
+    worksheet = make_worksheet(rows)
+
+    assert list(SheetsClient._iter_topic_rows(worksheet, limit=1)) == [
+        (2, {"Topic": "Topic 1", "Site Domain": "example.com", "Status": "Completed"})
+    ]
+
+
+def test_topics_below_blank_rows_are_found():
+    rows = [HEADERS, ["Topic 1", "example.com", "Completed"], [], []]
+    rows += [["Topic 2", "example.com", ""]]
+    worksheet = make_worksheet(rows)
+
+    topics = make_client(worksheet).get_pending_topics(limit=1)
+
+    assert [(topic.row_number, topic.topic) for topic in topics] == [(5, "Topic 2")]
+
+
+def test_rows_without_topic_or_site_domain_are_skipped():
+    rows = [HEADERS, ["", "example.com", ""], ["Topic 2", "", ""], ["Topic 3", "example.com", ""]]
+    worksheet = make_worksheet(rows)
+
+    topics = make_client(worksheet).get_pending_topics(limit=5)
+
+    assert [topic.row_number for topic in topics] == [4]
+
+
+def test_stale_processing_rows_are_retried():
+    fresh = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+    stale = (datetime.now(timezone.utc) - timedelta(hours=3)).strftime("%Y-%m-%d %H:%M:%S")
+    rows = [HEADERS + ["Started At"],
+            ["Topic 1", "example.com", "Processing", fresh],
+            ["Topic 2", "example.com", "Processing", stale],
+            ["Topic 3", "example.com", "Processing", ""]]
+    client = make_client(make_worksheet(rows))
+    client.settings = mock.MagicMock(processing_timeout_minutes=120)
+
+    topics = client.get_pending_topics(limit=5)
+
+    assert [topic.row_number for topic in topics] == [3, 4]